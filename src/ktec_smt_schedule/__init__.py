@@ -1,2 +1,38 @@
-from .smt_schedule import SMTSchedule
-from .lot_info import LotInfo
+import importlib
+
+# 公開するクラスと定義モジュール（pandasを使わない用途のため、参照時に読み込む）
+_EXPORTS = {
+    "SMTSchedule": ".smt_schedule",
+    "LotInfo": ".lot_info",
+    "ScheduleRecords": ".records",
+    "ScheduleArchive": ".archive",
+    "ArchiveAggregator": ".archive",
+    "LineMonthVolumeAggregator": ".archive",
+    "LotLeadTimeAggregator": ".archive",
+    "PlanStabilityAggregator": ".archive",
+    "SharedScheduleCache": ".shared_cache",
+    "ScheduleLayout": ".layout",
+    "ScheduleTimeline": ".timeline",
+    "ShiftCalendar": ".shift",
+    "ShiftPlanner": ".shift",
+    "DueDateAnalyzer": ".due_date",
+    "SetupFamily": ".setup_family",
+    "ScheduleSource": ".federation",
+    "FederationResult": ".federation",
+    "FederatedSchedule": ".federation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,408 @@
+import gc
+import os
+import pickle
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .smt_schedule import SMTSchedule
+
+
+class ArchiveAggregator:
+    """
+    アーカイブ集計の基底クラス
+
+    スナップショットを1件ずつ受け取り、小さな状態(state)だけを保持して集計する。
+    状態はチェックポイントにpickleで保存されるため、pickle可能な値で構成すること。
+
+    Attributes:
+        name (str): 集計名（結果とチェックポイントのキー）
+        state (Any): 集計の途中状態
+    """
+
+    name: str = "aggregator"
+    "**集計名**"
+
+    def __init__(self):
+        self.state = self.initial_state()
+
+    def initial_state(self) -> Any:
+        """
+        集計の初期状態を返す
+
+        Returns:
+            Any: 初期状態
+        """
+        return {}
+
+    def update(self, snapshot: str, df: pd.DataFrame) -> None:
+        """
+        1スナップショット分のLotInfo DataFrameで状態を更新する
+
+        Args:
+            snapshot (str): スナップショット名（アーカイブのサブディレクトリ名）
+            df (pd.DataFrame): get_lot_infosの結果
+        """
+        raise NotImplementedError
+
+    def result(self) -> pd.DataFrame:
+        """
+        現在の状態から集計結果を生成する
+
+        Returns:
+            pd.DataFrame: 集計結果
+        """
+        raise NotImplementedError
+
+
+class LineMonthVolumeAggregator(ArchiveAggregator):
+    """
+    ライン別・月別の生産予定数を集計する
+
+    同じ日付が複数のスナップショットに含まれる場合は、最新のスナップショットの値を採用する。
+    スナップショットの日付範囲（SMTSchedule.get_horizons）内の値は最新の値で置き換えるため、
+    取り消された予定は集計から除かれる。
+    日付範囲の開始日より前の日は以後のスナップショットで置き換わらないため、
+    (ライン, 月) ごとの合計に畳み込む。日ごとの数量は日付範囲の分だけ保持するので、
+    状態は処理日数ではなくライン数・月数に比例する。
+    """
+
+    name = "line_month_volume"
+
+    def initial_state(self) -> Any:
+        # daily: (ライン, 日付)→数量, monthly: (ライン, 月)→数量, folded: ライン→確定日
+        return {"daily": {}, "monthly": {}, "folded": {}}
+
+    def update(self, snapshot: str, df: pd.DataFrame) -> None:
+        daily_state = self.state["daily"]
+        folded = self.state["folded"]
+        for machine_name, (start, end) in SMTSchedule.get_horizons(df).items():
+            start = pd.Timestamp(start).normalize()
+            self._fold(machine_name, start)
+            # スナップショットの日付範囲内の古い値を消す
+            for day in pd.date_range(folded[machine_name], end):
+                daily_state.pop((machine_name, day), None)
+        long_df = SMTSchedule.explode_productions(df)
+        if long_df.empty:
+            return
+        daily = long_df.groupby(["machine_name", "date"])["quantity"].sum()
+        # 最新スナップショットの値を適用（月別合計に畳み込み済みの日は除く）
+        for (machine_name, day), quantity in daily.items():
+            day = pd.Timestamp(day)
+            if machine_name in folded and day < folded[machine_name]:
+                continue
+            daily_state[(machine_name, day)] = quantity
+
+    def result(self) -> pd.DataFrame:
+        totals = dict(self.state["monthly"])
+        for (machine_name, day), quantity in self.state["daily"].items():
+            key = (machine_name, day.strftime("%Y-%m"))
+            totals[key] = totals.get(key, 0) + quantity
+        if not totals:
+            return pd.DataFrame(columns=["machine_name", "month", "quantity"])
+        return (
+            pd.DataFrame(
+                [(line, month, quantity) for (line, month), quantity in totals.items()],
+                columns=["machine_name", "month", "quantity"],
+            )
+            .sort_values(["machine_name", "month"])
+            .reset_index(drop=True)
+        )
+
+    def _fold(self, machine_name: str, start: pd.Timestamp) -> None:
+        """開始日より前の日ごとの数量を月別合計に移す"""
+        folded = self.state["folded"]
+        if machine_name in folded and start <= folded[machine_name]:
+            return
+        daily_state = self.state["daily"]
+        monthly = self.state["monthly"]
+        for key in [k for k in daily_state if k[0] == machine_name and k[1] < start]:
+            month_key = (machine_name, key[1].strftime("%Y-%m"))
+            monthly[month_key] = monthly.get(month_key, 0) + daily_state.pop(key)
+        folded[machine_name] = start
+
+
+class LotLeadTimeAggregator(ArchiveAggregator):
+    """
+    指図ごとのリードタイムを集計する
+
+    指図が最初に現れたスナップショットから、最後に計画された生産日までの日数を求める。
+    スナップショット名は日付として解釈できる必要がある（例: 20251002）。
+    """
+
+    name = "lot_lead_time"
+
+    def update(self, snapshot: str, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        snapshot_date = pd.to_datetime(snapshot, errors="coerce")
+        if pd.isna(snapshot_date):
+            print(f"スナップショット名を日付として解釈できません: {snapshot}")
+            return
+        long_df = SMTSchedule.explode_productions(df)
+        if long_df.empty:
+            return
+        last_dates = long_df.groupby("lot_number")["date"].max()
+        for lot_number, last_date in last_dates.items():
+            first_seen, _ = self.state.get(lot_number, (snapshot_date, None))
+            self.state[lot_number] = (first_seen, pd.Timestamp(last_date))
+
+    def result(self) -> pd.DataFrame:
+        if not self.state:
+            return pd.DataFrame(
+                columns=["lot_number", "first_seen", "last_planned", "lead_time_days"]
+            )
+        df = pd.DataFrame(
+            [
+                (lot_number, first_seen, last_planned)
+                for lot_number, (first_seen, last_planned) in self.state.items()
+            ],
+            columns=["lot_number", "first_seen", "last_planned"],
+        )
+        df["lead_time_days"] = (df["last_planned"] - df["first_seen"]).dt.days
+        return df
+
+
+class PlanStabilityAggregator(ArchiveAggregator):
+    """
+    計画の安定性（前回のスナップショットからの変更）をライン・スナップショットごとに集計する
+
+    前回と今回のスナップショットの日付範囲が重なる期間で、指図ごとの日別数量を比較する。
+    数量か日付が変わった指図（範囲内で取り消された・追加された指図を含む）を変更として数える。
+    状態はラインごとの前回の計画と集計行のみなので、処理日数に対してほぼ一定に保たれる。
+    """
+
+    name = "plan_stability"
+
+    COLUMNS = [
+        "snapshot",
+        "machine_name",
+        "lots",
+        "changed_lots",
+        "date_changed_lots",
+        "quantity_change",
+        "stability",
+    ]
+    "**result()の列**"
+
+    def initial_state(self) -> Any:
+        return {"plans": {}, "horizons": {}, "rows": []}
+
+    def update(self, snapshot: str, df: pd.DataFrame) -> None:
+        horizons = SMTSchedule.get_horizons(df)
+        long_df = SMTSchedule.explode_productions(df)
+        long_df = long_df[long_df["quantity"].notna() & (long_df["quantity"] != 0)]
+        plans: Dict[str, Dict[Any, Dict[pd.Timestamp, float]]] = {
+            machine_name: {} for machine_name in horizons
+        }
+        for (machine_name, lot_number), group in long_df.groupby(
+            ["machine_name", "lot_number"], sort=False
+        ):
+            plans[machine_name][lot_number] = dict(
+                zip(group["date"], group["quantity"])
+            )
+
+        for machine_name, (start, end) in horizons.items():
+            previous = self.state["plans"].get(machine_name)
+            if previous is not None:
+                previous_start, previous_end = self.state["horizons"][machine_name]
+                self.state["rows"].append(
+                    self._compare(
+                        snapshot,
+                        machine_name,
+                        previous,
+                        plans[machine_name],
+                        max(start, previous_start),
+                        min(end, previous_end),
+                    )
+                )
+            self.state["plans"][machine_name] = plans[machine_name]
+            self.state["horizons"][machine_name] = (start, end)
+
+    def result(self) -> pd.DataFrame:
+        return pd.DataFrame(self.state["rows"], columns=self.COLUMNS)
+
+    @staticmethod
+    def _compare(
+        snapshot: str,
+        machine_name: str,
+        previous: Dict[Any, Dict[pd.Timestamp, float]],
+        current: Dict[Any, Dict[pd.Timestamp, float]],
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> Tuple:
+        """重なる期間の指図ごとの計画を比較して集計行を返す"""
+        lots = changed_lots = date_changed_lots = 0
+        quantity_change = 0.0
+        added = [lot_number for lot_number in current if lot_number not in previous]
+        for lot_number in list(previous) + added:
+            before = {
+                day: quantity
+                for day, quantity in previous.get(lot_number, {}).items()
+                if start <= day <= end
+            }
+            after = {
+                day: quantity
+                for day, quantity in current.get(lot_number, {}).items()
+                if start <= day <= end
+            }
+            if not before and not after:
+                continue
+            lots += 1
+            if before == after:
+                continue
+            changed_lots += 1
+            if before.keys() != after.keys():
+                date_changed_lots += 1
+            quantity_change += sum(
+                abs(after.get(day, 0.0) - before.get(day, 0.0))
+                for day in before.keys() | after.keys()
+            )
+        stability = 1 - changed_lots / lots if lots else float("nan")
+        return (
+            snapshot,
+            machine_name,
+            lots,
+            changed_lots,
+            date_changed_lots,
+            quantity_change,
+            stability,
+        )
+
+
+class ScheduleArchive:
+    """
+    日次アーカイブされたスケジュールファイルを一定メモリで集計する
+
+    アーカイブディレクトリ直下のサブディレクトリを1日分のスナップショットとして扱い、
+    名前順に1件ずつ解析して集計器に渡す。解析結果は次のスナップショットに進む前に解放される。
+    chunk_size件ごとに集計器の途中状態をチェックポイントへ保存し、中断後は続きから再開できる。
+
+    Example:
+        archive/
+            20251001/GC01.xls, GC02.xls, ...
+            20251002/GC01.xls, GC02.xls, ...
+    """
+
+    def __init__(
+        self,
+        archive_dir: str,
+        start_line: int,
+        end_line: int,
+        checkpoint_path: Optional[str] = None,
+        chunk_size: int = 10,
+    ):
+        """
+        Args:
+            archive_dir (str): スナップショットのサブディレクトリを含むディレクトリパス
+            start_line (int): 開始ライン番号
+            end_line (int): 終了ライン番号
+            checkpoint_path (Optional[str]): チェックポイントファイルのパス（Noneなら保存しない）
+            chunk_size (int): チェックポイントを保存する間隔（スナップショット数）
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_sizeは1以上を指定してください: {chunk_size}")
+        self.archive_dir = archive_dir
+        self.start_line = start_line
+        self.end_line = end_line
+        self.checkpoint_path = checkpoint_path
+        self.chunk_size = chunk_size
+
+    def snapshots(self) -> List[str]:
+        """
+        アーカイブ内のスナップショット名を名前順で返す
+
+        Returns:
+            List[str]: スナップショット名のリスト
+        """
+        if not os.path.isdir(self.archive_dir):
+            raise FileNotFoundError(
+                f"指定されたディレクトリが存在しません: {self.archive_dir}"
+            )
+        return sorted(
+            entry.name for entry in os.scandir(self.archive_dir) if entry.is_dir()
+        )
+
+    def iter_snapshots(
+        self, after: Optional[str] = None
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        スナップショットを1件ずつ解析して返すジェネレータ
+
+        Args:
+            after (Optional[str]): このスナップショット名以前はスキップする
+
+        Yields:
+            Tuple[str, pd.DataFrame]: スナップショット名とget_lot_infosの結果
+        """
+        for snapshot in self.snapshots():
+            if after is not None and snapshot <= after:
+                continue
+            df = SMTSchedule.get_lot_infos(
+                os.path.join(self.archive_dir, snapshot),
+                self.start_line,
+                self.end_line,
+                output_csv=False,
+            )
+            yield snapshot, df
+
+    def run(self, aggregators: List[ArchiveAggregator]) -> Dict[str, pd.DataFrame]:
+        """
+        全スナップショットを集計する
+
+        チェックポイントが存在する場合は、保存済みの状態を復元して続きから処理する。
+
+        Args:
+            aggregators (List[ArchiveAggregator]): 集計器のリスト
+
+        Returns:
+            Dict[str, pd.DataFrame]: 集計名をキーとする集計結果
+        """
+        names = [aggregator.name for aggregator in aggregators]
+        if len(set(names)) != len(names):
+            raise ValueError(f"集計名が重複しています: {names}")
+
+        last_snapshot = self._load_checkpoint(aggregators)
+        processed = 0
+        for snapshot, df in self.iter_snapshots(after=last_snapshot):
+            for aggregator in aggregators:
+                aggregator.update(snapshot, df)
+            del df
+            last_snapshot = snapshot
+            processed += 1
+            if processed % self.chunk_size == 0:
+                self._save_checkpoint(aggregators, last_snapshot)
+                gc.collect()
+
+        if processed % self.chunk_size != 0:
+            self._save_checkpoint(aggregators, last_snapshot)
+
+        return {aggregator.name: aggregator.result() for aggregator in aggregators}
+
+    def _load_checkpoint(self, aggregators: List[ArchiveAggregator]) -> Optional[str]:
+        """チェックポイントから集計器の状態を復元し、最後に処理したスナップショット名を返す"""
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, "rb") as f:
+            checkpoint = pickle.load(f)
+        states = checkpoint.get("states", {})
+        for aggregator in aggregators:
+            if aggregator.name in states:
+                aggregator.state = states[aggregator.name]
+        print(f"チェックポイントから再開します: {checkpoint.get('last_snapshot')}")
+        return checkpoint.get("last_snapshot")
+
+    def _save_checkpoint(
+        self, aggregators: List[ArchiveAggregator], last_snapshot: Optional[str]
+    ):
+        """集計器の状態をチェックポイントに保存する（一時ファイル経由で置き換える）"""
+        if self.checkpoint_path is None:
+            return
+        checkpoint = {
+            "last_snapshot": last_snapshot,
+            "states": {aggregator.name: aggregator.state for aggregator in aggregators},
+        }
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.checkpoint_path)
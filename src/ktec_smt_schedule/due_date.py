@@ -0,0 +1,175 @@
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .smt_schedule import SMTSchedule
+
+
+class DueDateAnalyzer:
+    """
+    基準日(default_date)と生産予定から指図ごとの余裕日数・遅れを分析する
+
+    余裕日数は生産カレンダー（稼働曜日と休日）上の稼働日数で数える。
+    結果はラインごとに保持するため、1ラインだけ変わった場合はそのラインだけ再計算できる。
+
+    Example:
+        analyzer = DueDateAnalyzer(holidays=[date(2025, 10, 13)])
+        analyzer.update(SMTSchedule.get_lot_infos(dir_path, 1, 20))
+        analyzer.update(SMTSchedule.get_lot_info(dir_path, "GC05"))  # GC05のみ再計算
+        summary = analyzer.summary()
+    """
+
+    COLUMNS = [
+        "machine_name",
+        "lot_number",
+        "default_date",
+        "planned_completion",
+        "planned_quantity",
+        "remaining_volume",
+        "unplanned_volume",
+        "slack_days",
+        "lateness_days",
+        "is_late",
+    ]
+    SUMMARY_COLUMNS = [
+        "machine_name",
+        "lots",
+        "late_lots",
+        "late_quantity",
+        "total_lateness_days",
+        "max_lateness_days",
+        "min_slack_days",
+    ]
+
+    def __init__(self, holidays: Iterable[date] = (), weekmask: str = "1111100"):
+        """
+        Args:
+            holidays (Iterable[date]): 休日
+            weekmask (str): 稼働曜日（月曜から日曜の順に1が稼働日、np.busday_countと同じ形式）
+        """
+        self.holidays = np.array(
+            [pd.Timestamp(day).date() for day in holidays], dtype="datetime64[D]"
+        )
+        self.weekmask = weekmask
+        self._lines: Dict[str, pd.DataFrame] = {}
+
+    def analyze(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        指図ごとの計画完了日・余裕日数・遅れ・残数量を一括計算する
+
+        Args:
+            df (pd.DataFrame): get_lot_info / get_lot_infosの結果
+
+        Returns:
+            pd.DataFrame: COLUMNSの列を持つ指図ごとの分析結果
+        """
+        if df.empty:
+            return pd.DataFrame(columns=self.COLUMNS)
+
+        # 数量のある日付のうち最後の日を計画完了日とする
+        long_df = SMTSchedule.explode_productions(df, with_position=True)
+        long_df = long_df[long_df["quantity"] > 0]
+        grouped = long_df.groupby("position")
+        completion = grouped["date"].max().reindex(range(len(df)))
+        planned = grouped["quantity"].sum().reindex(range(len(df)), fill_value=0.0)
+
+        due = pd.to_datetime(df["default_date"], errors="coerce").dt.normalize()
+        due_days = due.to_numpy(dtype="datetime64[D]")
+        completion_days = completion.to_numpy(dtype="datetime64[D]")
+
+        # 計画完了日から基準日までの稼働日数（負なら遅れ）
+        valid = ~(np.isnat(due_days) | np.isnat(completion_days))
+        slack = np.full(len(df), np.nan)
+        slack[valid] = np.busday_count(
+            completion_days[valid],
+            due_days[valid],
+            weekmask=self.weekmask,
+            holidays=self.holidays,
+        )
+        lateness = np.where(np.isnan(slack), np.nan, np.clip(-slack, 0, None))
+
+        # 残台数があればそれを、なければ台数を残数量とする
+        volume = self._numeric(df, "volume")
+        rest_volume = self._numeric(df, "rest_volume")
+        remaining = np.where(rest_volume > 0, rest_volume, volume)
+        planned_quantity = planned.to_numpy(dtype=float)
+
+        return pd.DataFrame(
+            {
+                "machine_name": df["machine_name"].to_numpy(),
+                "lot_number": df["lot_number"].to_numpy(),
+                "default_date": due.to_numpy(),
+                "planned_completion": completion.to_numpy(),
+                "planned_quantity": planned_quantity,
+                "remaining_volume": remaining,
+                "unplanned_volume": np.clip(remaining - planned_quantity, 0, None),
+                "slack_days": slack,
+                "lateness_days": lateness,
+                "is_late": lateness > 0,
+            },
+            columns=self.COLUMNS,
+        )
+
+    def update(self, df: pd.DataFrame, lines: Optional[List[str]] = None) -> None:
+        """
+        指定したラインの分析結果だけを再計算する
+
+        Args:
+            df (pd.DataFrame): 対象ラインのget_lot_info / get_lot_infosの結果
+            lines (Optional[List[str]]): 再計算するライン（省略時はdfに含まれるライン）。
+                dfに指図がないラインは結果から削除される
+        """
+        if lines is None:
+            lines = [] if df.empty else list(pd.unique(df["machine_name"]))
+        for line in lines:
+            self._lines.pop(line, None)
+        if df.empty:
+            return
+        target = df[df["machine_name"].isin(lines)].reset_index(drop=True)
+        result = self.analyze(target)
+        for line, group in result.groupby("machine_name", sort=False):
+            self._lines[line] = group.reset_index(drop=True)
+
+    def result(self) -> pd.DataFrame:
+        """
+        全ラインの指図ごとの分析結果を返す
+
+        Returns:
+            pd.DataFrame: COLUMNSの列を持つDataFrame
+        """
+        if not self._lines:
+            return pd.DataFrame(columns=self.COLUMNS)
+        return pd.concat(self._lines.values(), ignore_index=True)
+
+    def summary(self) -> pd.DataFrame:
+        """
+        ラインごとの遅れの集計を返す
+
+        Returns:
+            pd.DataFrame: SUMMARY_COLUMNSの列を持つDataFrame
+        """
+        result = self.result()
+        if result.empty:
+            return pd.DataFrame(columns=self.SUMMARY_COLUMNS)
+        result = result.assign(
+            late_quantity=result["planned_quantity"].where(result["is_late"], 0.0)
+        )
+        summary = result.groupby("machine_name", sort=False).agg(
+            lots=("lot_number", "size"),
+            late_lots=("is_late", "sum"),
+            late_quantity=("late_quantity", "sum"),
+            total_lateness_days=("lateness_days", "sum"),
+            max_lateness_days=("lateness_days", "max"),
+            min_slack_days=("slack_days", "min"),
+        )
+        return summary.reset_index()[self.SUMMARY_COLUMNS]
+
+    @staticmethod
+    def _numeric(df: pd.DataFrame, column: str) -> np.ndarray:
+        """数値列を取り出す（列がない・数値でない値は0）"""
+        if column not in df.columns:
+            return np.zeros(len(df))
+        values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+        return np.nan_to_num(values, nan=0.0)
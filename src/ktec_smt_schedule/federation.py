@@ -0,0 +1,160 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+from .smt_schedule import SMTSchedule
+
+
+@dataclass
+class ScheduleSource:
+    """
+    工場ごとのスケジュールの読み込み元
+
+    Attributes:
+        plant_id (str): 工場ID
+        dir_path (str): Excelファイルが格納されているディレクトリパス
+        pattern (str): ラインファイル名のパターン（fnmatch形式）
+    """
+
+    plant_id: str
+    "**工場ID**"
+    dir_path: str
+    "**ディレクトリパス**"
+    pattern: str = "GC[0-9][0-9].*"
+    "**ラインファイル名のパターン**"
+
+
+@dataclass
+class FederationResult:
+    """
+    複数工場の読み込み結果
+
+    Attributes:
+        lots (pd.DataFrame): plant_id列を先頭に加えた全工場のLotInfo情報
+        status (pd.DataFrame): 工場ごとの読み込み状況
+            （plant_id, dir_path, lines, lots, elapsed_sec, error, line_errors）
+        errors (Dict[str, str]): 読み込みに失敗した工場のエラー内容
+    """
+
+    lots: pd.DataFrame
+    "**全工場のLotInfo情報**"
+    status: pd.DataFrame
+    "**工場ごとの読み込み状況**"
+    errors: Dict[str, str] = field(default_factory=dict)
+    "**工場IDをキーとするエラー内容**"
+
+
+class FederatedSchedule:
+    """複数工場のスケジュールディレクトリを並行して読み込む"""
+
+    STATUS_COLUMNS = [
+        "plant_id",
+        "dir_path",
+        "lines",
+        "lots",
+        "elapsed_sec",
+        "error",
+        "line_errors",
+    ]
+
+    @staticmethod
+    def load_manifest(path: str) -> List[ScheduleSource]:
+        """
+        JSONのマニフェストから読み込み元を生成する
+
+        Example:
+            [{"plant_id": "P1", "dir_path": "//share1/smt", "pattern": "GC??.xls"}]
+
+        Args:
+            path (str): マニフェストファイルのパス
+
+        Returns:
+            List[ScheduleSource]: 読み込み元のリスト
+        """
+        with open(path, encoding="utf-8-sig") as f:
+            return [ScheduleSource(**source) for source in json.load(f)]
+
+    @staticmethod
+    def load(
+        sources: Iterable[Union[ScheduleSource, Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+    ) -> FederationResult:
+        """
+        全工場のスケジュールを並行して読み込み、工場IDを付けて連結する
+
+        各工場のラインファイルはディレクトリを1回列挙して見つける（存在しないラインは探さない）。
+        工場単位でスレッドに割り当てるため、遅い共有フォルダの待ち時間が重ならない。
+
+        Args:
+            sources (Iterable[Union[ScheduleSource, Dict[str, Any]]]): 読み込み元
+            max_workers (Optional[int]): 同時に読み込む工場数（省略時は工場数）
+
+        Returns:
+            FederationResult: 連結したLotInfo情報と工場ごとの読み込み状況
+        """
+        sources = [
+            source if isinstance(source, ScheduleSource) else ScheduleSource(**source)
+            for source in sources
+        ]
+        plant_ids = [source.plant_id for source in sources]
+        if len(set(plant_ids)) != len(plant_ids):
+            raise ValueError(f"工場IDが重複しています: {plant_ids}")
+        if not sources:
+            return FederationResult(
+                pd.DataFrame(), pd.DataFrame(columns=FederatedSchedule.STATUS_COLUMNS)
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(sources)) as executor:
+            results = list(executor.map(FederatedSchedule._load_source, sources))
+
+        frames = [df for df, _ in results if not df.empty]
+        lots = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        status = pd.DataFrame(
+            [status for _, status in results], columns=FederatedSchedule.STATUS_COLUMNS
+        )
+        errors = {row.plant_id: row.error for row in status.itertuples() if row.error}
+        return FederationResult(lots, status, errors)
+
+    @staticmethod
+    def _load_source(source: ScheduleSource):
+        """1工場分を読み込み、(LotInfo DataFrame, 読み込み状況) を返す"""
+        started = time.perf_counter()
+        status = {
+            "plant_id": source.plant_id,
+            "dir_path": source.dir_path,
+            "lines": 0,
+            "lots": 0,
+            "elapsed_sec": 0.0,
+            "error": "",
+            "line_errors": {},
+        }
+        df_list = []
+        try:
+            line_codes = SMTSchedule.discover_line_codes(
+                source.dir_path, source.pattern
+            )
+            status["lines"] = len(line_codes)
+            for line_code in line_codes:
+                try:
+                    df = SMTSchedule.get_lot_info(
+                        source.dir_path, line_code, output_csv=False
+                    )
+                    if not df.empty:
+                        df_list.append(df)
+                except Exception as e:
+                    status["line_errors"][line_code] = str(e)
+        except Exception as e:
+            status["error"] = str(e)
+
+        if df_list:
+            df = pd.concat(df_list, ignore_index=True)
+            df.insert(0, "plant_id", source.plant_id)
+        else:
+            df = pd.DataFrame()
+        status["lots"] = len(df)
+        status["elapsed_sec"] = time.perf_counter() - started
+        return df, status
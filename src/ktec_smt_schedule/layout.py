@@ -0,0 +1,219 @@
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# 日付列のラベル・日付文字列（年, 月, 日）
+_DATE_PATTERN = re.compile(r"^(\d{4})[-/](\d{1,2})[-/](\d{1,2})")
+
+
+def _is_date_label(value: Any) -> bool:
+    """ヘッダーのセルが日付列のラベルかどうかを判定する"""
+    if isinstance(value, date):
+        return True
+    if isinstance(value, str):
+        return _DATE_PATTERN.match(value.strip()) is not None
+    return False
+
+
+def _is_blank(value: Any) -> bool:
+    """セルが空かどうかを判定する（NaN・NaT・pd.NAも空とみなす）"""
+    if value is None or type(value).__name__ == "NAType":
+        return True
+    try:
+        return bool(value != value)
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass(frozen=True)
+class ScheduleLayout:
+    """
+    スケジュールシートのレイアウト
+
+    行番号は読み込んだシートの行位置、列番号は先頭列を除いた後の列位置を表す。
+
+    Attributes:
+        header_row (int): ヘッダー行の位置
+        data_start (int): データ行を探す最初の行の位置（ヘッダー行の次の行）
+        first_col (int): 先頭の有効列（品 目 名 称）の位置
+        date_start (int): 最初の日付列の位置
+        date_stop (int): 最後の日付列の次の位置
+        filter_col (int): データ行の判定に使う数値列の位置
+        tact_col (Optional[int]): タクト列の位置（ない場合はNone）
+        changeover_col (Optional[int]): 切替列の位置（ない場合はNone）
+    """
+
+    header_row: int
+    "**ヘッダー行**"
+    data_start: int
+    "**データ行の探索開始行**"
+    first_col: int
+    "**先頭列**"
+    date_start: int
+    "**日付列の開始**"
+    date_stop: int
+    "**日付列の終了（この列を含まない）**"
+    filter_col: int
+    "**数値判定列**"
+    tact_col: Optional[int] = None
+    "**タクト列**"
+    changeover_col: Optional[int] = None
+    "**切替列**"
+
+    # ヘッダー行を探索する行数
+    SEARCH_ROWS = 30
+    # ヘッダー行に必ず含まれるラベル
+    KEY_LABELS = ("品 目 名 称", "指図－工程", "基 準", "前 月 累 計", "日付", "取数")
+    # データ行の判定に使う列のラベル
+    FILTER_LABEL = "稼働率(%)"
+    # タクト列のラベルの先頭
+    TACT_LABEL_PREFIX = "タクト"
+    # 切替列のラベル
+    CHANGEOVER_LABEL = "切替"
+    # 判定列のラベルがない場合の、日付列の終了位置からの距離
+    FILTER_OFFSET = 6
+
+    @property
+    def date_columns(self) -> range:
+        """日付列の位置"""
+        return range(self.date_start, self.date_stop)
+
+    @classmethod
+    def detect(cls, rows: Sequence[Sequence[Any]]) -> "ScheduleLayout":
+        """
+        シート先頭の行からヘッダー行・日付列・キー列を検出する
+
+        Args:
+            rows (Sequence[Sequence[Any]]): シート先頭の行（SEARCH_ROWS行程度）
+
+        Returns:
+            ScheduleLayout: 検出したレイアウト
+        """
+        header_row = cls._find_header_row(rows)
+        if header_row is None:
+            raise ValueError(
+                f"ヘッダー行が見つかりません。必要なラベル: {', '.join(cls.KEY_LABELS)}"
+            )
+        header = list(rows[header_row])
+        labels = [str(v).strip() if not _is_blank(v) else "" for v in header]
+        missing = [label for label in cls.KEY_LABELS if label not in labels]
+        if missing:
+            raise ValueError(f"必要な列が見つかりません: {', '.join(missing)}")
+
+        first_col = labels.index(cls.KEY_LABELS[0])
+
+        # 最も長く連続する日付ラベルの範囲を日付列とする
+        best: Tuple[int, int] = (0, 0)
+        start: Optional[int] = None
+        for j, value in enumerate(header + [None]):
+            if j < len(header) and _is_date_label(value):
+                if start is None:
+                    start = j
+            elif start is not None:
+                if j - start > best[1] - best[0]:
+                    best = (start, j)
+                start = None
+        if best[1] <= first_col:
+            raise ValueError("日付列が見つかりません")
+        date_start, date_stop = best[0] - first_col, best[1] - first_col
+
+        if cls.FILTER_LABEL in labels:
+            filter_col = labels.index(cls.FILTER_LABEL) - first_col
+        else:
+            filter_col = date_stop + cls.FILTER_OFFSET
+        if filter_col >= len(header) - first_col:
+            raise ValueError(f"数値判定列が範囲外です: {filter_col}")
+
+        tact_col = next(
+            (
+                j - first_col
+                for j, label in enumerate(labels)
+                if j > first_col and label.startswith(cls.TACT_LABEL_PREFIX)
+            ),
+            None,
+        )
+        changeover_col = (
+            labels.index(cls.CHANGEOVER_LABEL) - first_col
+            if cls.CHANGEOVER_LABEL in labels
+            else None
+        )
+
+        return cls(
+            header_row=header_row,
+            # ヘッダー行とデータ行の間の空行の数は決め打ちせず、
+            # 空行・見出し行はデータ行の判定（先頭列・数値判定列）で除く
+            data_start=header_row + 1,
+            first_col=first_col,
+            date_start=date_start,
+            date_stop=date_stop,
+            filter_col=filter_col,
+            tact_col=tact_col,
+            changeover_col=changeover_col,
+        )
+
+    @classmethod
+    def resolve(cls, rows: Sequence[Sequence[Any]]) -> "ScheduleLayout":
+        """
+        レイアウトの指紋でキャッシュを引き、未知のレイアウトの場合のみ検出する
+
+        Args:
+            rows (Sequence[Sequence[Any]]): シート先頭の行
+
+        Returns:
+            ScheduleLayout: レイアウト
+        """
+        for header_row in _HEADER_ROWS:
+            if header_row < len(rows):
+                layout = _LAYOUT_CACHE.get(cls.fingerprint(rows, header_row))
+                if layout is not None:
+                    return layout
+
+        layout = cls.detect(rows)
+        _LAYOUT_CACHE[cls.fingerprint(rows, layout.header_row)] = layout
+        if layout.header_row not in _HEADER_ROWS:
+            _HEADER_ROWS.append(layout.header_row)
+        return layout
+
+    @staticmethod
+    def fingerprint(rows: Sequence[Sequence[Any]], header_row: int) -> Tuple:
+        """
+        レイアウトの指紋を返す
+
+        日付ラベルは日々変わるため、日付列は位置のみを指紋に含める。
+
+        Args:
+            rows (Sequence[Sequence[Any]]): シート先頭の行
+            header_row (int): ヘッダー行の位置
+
+        Returns:
+            Tuple: 列数・ヘッダー行位置・ヘッダーラベルからなる指紋
+        """
+        header = rows[header_row]
+        labels = tuple(
+            "<date>" if _is_date_label(v) else "" if _is_blank(v) else str(v).strip()
+            for v in header
+        )
+        return (len(header), header_row, labels)
+
+    @staticmethod
+    def clear_cache():
+        """レイアウトのキャッシュを消去する"""
+        _LAYOUT_CACHE.clear()
+        _HEADER_ROWS.clear()
+
+    @classmethod
+    def _find_header_row(cls, rows: Sequence[Sequence[Any]]) -> Optional[int]:
+        """先頭のキーラベルを含む行を探す"""
+        for i, row in enumerate(rows[: cls.SEARCH_ROWS]):
+            labels = {str(v).strip() for v in row if not _is_blank(v)}
+            if cls.KEY_LABELS[0] in labels and cls.KEY_LABELS[1] in labels:
+                return i
+        return None
+
+
+# 指紋をキーとするレイアウトのキャッシュ
+_LAYOUT_CACHE: Dict[Tuple, ScheduleLayout] = {}
+# キャッシュ済みレイアウトのヘッダー行位置（指紋の計算に使う）
+_HEADER_ROWS: List[int] = []
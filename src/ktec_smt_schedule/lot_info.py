@@ -18,6 +18,8 @@ class LotInfo:
         volume (int): 台数
         line_code (str): 棚番
         productions (List[Dict[date, int]]): 生産予定
+        tact (float): タクト（秒/台）
+        changeover_time (float): 切替時間
     """
 
     machine_name: str
@@ -42,6 +44,10 @@ class LotInfo:
     "**生産予定**"
     divisions_volume: int
     "**分割台数**"
+    tact: float
+    "**タクト（秒/台）**"
+    changeover_time: float
+    "**切替時間**"
 
     def __init__(self):
         self.machine_name = ""
@@ -55,3 +61,5 @@ class LotInfo:
         self.line_code = ""
         self.productions = {}
         self.divisions_volume = 0
+        self.tact = 0.0
+        self.changeover_time = 0.0
@@ -0,0 +1,679 @@
+import dataclasses
+import json
+import numbers
+import os
+import re
+from contextlib import closing
+from datetime import date, datetime
+from itertools import chain, islice
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .layout import _DATE_PATTERN, ScheduleLayout, _is_blank
+from .lot_info import LotInfo
+
+# to_db_insert()のテーブル名（スキーマ名.テーブル名も可）
+_TABLE_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+
+DateRange = Optional[Union[date, Tuple[Optional[date], Optional[date]]]]
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """値を数値に変換する（数値でない場合はNone）"""
+    if isinstance(value, numbers.Number) and not isinstance(value, complex):
+        number = float(value)
+        return None if number != number else number
+    if isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+        return None if number != number else number
+    return None
+
+
+def _to_date(value: Any) -> Optional[date]:
+    """日付・日時・日付文字列・datetime64を日付に変換する（変換できない場合はNone）"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        match = _DATE_PATTERN.match(value.strip())
+        if match:
+            return date(*(int(group) for group in match.groups()))
+    if type(value).__name__ == "datetime64":
+        # NumPyのdatetime64（NaTはNone）
+        day = value.astype("datetime64[D]").item()
+        return day if isinstance(day, date) else None
+    return None
+
+
+def _nan_if_blank(value: Any) -> Any:
+    """空のセルをpd.read_excelと同じNaNにする（数値列の型を揃えるため）"""
+    return float("nan") if _is_blank(value) else value
+
+
+def _to_float(row: Sequence[Any], col: Optional[int]) -> float:
+    """行の指定位置の値を数値に変換する（列がない・数値でない場合は0）"""
+    if col is None:
+        return 0.0
+    value = _to_number(row[col])
+    return value if value is not None else 0.0
+
+
+def _jsonable(value: Any) -> Any:
+    """JSONに変換できる値にする（日付はISO形式、NaNはNone）"""
+    if isinstance(value, dict):
+        return {
+            k.isoformat() if isinstance(k, date) else str(k): _jsonable(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, date):
+        return value.isoformat()
+    if _is_blank(value):
+        return None
+    if hasattr(value, "item"):
+        # NumPyのスカラー
+        return value.item()
+    return value
+
+
+class ScheduleRecords:
+    """
+    pandasを使わずにスケジュールを読み込み、指図ごとのレコード（辞書のリスト）を返す
+
+    レコードのキーと値はget_lot_infoのDataFrameの列と同じ。
+    DataFrame・NumPy配列・NDJSON・DB-APIの一括登録形式へはアダプターで変換する。
+
+    Example:
+        records = ScheduleRecords.get_lot_records(dir_path, "GC05", fields=["lot_number"])
+        cursor.executemany(*ScheduleRecords.to_db_insert(records, "lots"))
+    """
+
+    SUPPORT_EXTENSIONS = [".xlsx", ".xls"]
+    "**対応するファイル拡張子（優先順）**"
+
+    FIELDS = [f.name for f in dataclasses.fields(LotInfo)]
+    "**レコードの項目（LotInfoの項目順）**"
+
+    NUMERIC_FIELDS = [
+        "volume",
+        "rest_volume",
+        "divisions_volume",
+        "tact",
+        "changeover_time",
+    ]
+    "**to_columns()で数値配列にする項目**"
+
+    PARAMSTYLES = ("qmark", "numeric", "named", "format", "pyformat")
+    "**to_db_insert()が対応するDB-APIのparamstyle**"
+
+    # 指図行（偶数行）から読み込む項目
+    LOT_ROW_FIELDS = {
+        "model_name": lambda row, col, layout: row[col["品 目 名 称"]],
+        "default_date": lambda row, col, layout: row[col["基 準"]],
+        # 残台数（空欄は0）
+        "rest_volume": lambda row, col, layout: (
+            row[col["前 月 累 計"]] if not _is_blank(row[col["前 月 累 計"]]) else 0
+        ),
+        "line_code": lambda row, col, layout: row[col["日付"]],
+        "divisions_volume": lambda row, col, layout: (
+            _nan_if_blank(row[col["取数"]]) if row[col["取数"]] != "nan" else 0
+        ),
+        "tact": lambda row, col, layout: _to_float(row, layout.tact_col),
+        "changeover_time": lambda row, col, layout: _to_float(
+            row, layout.changeover_col
+        ),
+    }
+    "**指図行から読み込む項目**"
+
+    # 基板行（奇数行）から読み込む項目
+    BOARD_ROW_FIELDS = {
+        "board_name": lambda row, col, layout: row[col["品 目 名 称"]].split("/")[0],
+        "model_code": lambda row, col, layout: row[col["指図－工程"]],
+        "volume": lambda row, col, layout: (
+            _nan_if_blank(row[col["前 月 累 計"]])
+            if row[col["前 月 累 計"]] != "nan"
+            else 0
+        ),
+    }
+    "**基板行から読み込む項目**"
+
+    @staticmethod
+    def resolve_path(dir_path: str, line_code: str) -> str:
+        """
+        ライン識別コードに対応するExcelファイルのパスを返す
+        line_codeに拡張子が含まれない場合は .xlsx → .xls の順に探す
+
+        Args:
+            dir_path (str): Excelファイルが格納されているディレクトリパス
+            line_code (str): ライン識別コード（例: GC01, GC01.xlsx）
+
+        Returns:
+            str: Excelファイルのパス
+        """
+        _, ext = os.path.splitext(line_code)
+        if ext:
+            candidates = [os.path.join(dir_path, line_code)]
+        else:
+            candidates = [
+                os.path.join(dir_path, f"{line_code}{support_ext}")
+                for support_ext in ScheduleRecords.SUPPORT_EXTENSIONS
+            ]
+        for path in candidates:
+            if os.path.exists(path):
+                return path
+        raise FileNotFoundError(f"指定されたファイルが存在しません: {candidates[-1]}")
+
+    @staticmethod
+    def iter_rows(path: str) -> Iterator[Sequence[Any]]:
+        """
+        Excelファイルの最初のシートの行を先頭から1行ずつ返す
+        .xlsx はopenpyxlの読み取り専用モード、.xls はxlrdで読み込み、空のセルはNoneとする
+
+        Args:
+            path (str): Excelファイルのパス
+
+        Returns:
+            Iterator[Sequence[Any]]: 1行目を含むシートの行（列数は行ごとに異なる場合がある）
+        """
+        _, ext = os.path.splitext(path)
+        ext = ext.lower()
+        if ext == ".xlsx":
+            return ScheduleRecords._iter_xlsx(path)
+        if ext == ".xls":
+            return ScheduleRecords._iter_xls(path)
+        raise ValueError(
+            f"サポートされていないファイル形式です: {ext}。.xlsx または .xls ファイルを使用してください。"
+        )
+
+    @staticmethod
+    def select_fields(fields: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        出力する項目をLotInfoの項目順で返す
+
+        Args:
+            fields (Optional[Sequence[str]]): 項目（省略時は全項目）
+
+        Returns:
+            List[str]: LotInfoの項目順に並べた項目
+        """
+        if fields is None:
+            return list(ScheduleRecords.FIELDS)
+        unknown = [name for name in fields if name not in ScheduleRecords.FIELDS]
+        if unknown:
+            raise ValueError(f"LotInfoに存在しない項目です: {', '.join(unknown)}")
+        return [name for name in ScheduleRecords.FIELDS if name in fields]
+
+    @staticmethod
+    def data_rows(
+        rows: Iterable[Sequence[Any]], layout: ScheduleLayout
+    ) -> Tuple[List[Any], List[List[Any]]]:
+        """
+        シートの行からヘッダーと指図・基板のデータ行を取り出す
+        行は先頭から順に1回だけ走査し、データ行だけを残す
+
+        Args:
+            rows (Iterable[Sequence[Any]]): pd.read_excelと同じ行位置のシートの行
+            layout (ScheduleLayout): シートのレイアウト
+
+        Returns:
+            Tuple[List[Any], List[List[Any]]]: 先頭の空列を除いたヘッダーと、
+                ヘッダーと同じ列数にしたデータ行
+        """
+        first_col = layout.first_col
+        filter_col = first_col + layout.filter_col
+        header: List[Any] = []
+        data: List[List[Any]] = []
+        for index, row in enumerate(rows):
+            if index == layout.header_row:
+                header = list(row[first_col:])
+            elif (
+                index >= layout.data_start
+                # 先頭列が空白の行と、判定列が数値以外の行を除く
+                and len(row) > filter_col
+                and not _is_blank(row[first_col])
+                and _to_number(row[filter_col]) is not None
+            ):
+                values = list(row[first_col:])
+                values += [None] * (len(header) - len(values))
+                data.append(values[: len(header)])
+        return header, data
+
+    @staticmethod
+    def horizon(
+        header: Sequence[Any], layout: ScheduleLayout, dates: DateRange = None
+    ) -> Optional[Tuple[date, date]]:
+        """
+        エクスポートの日付列の範囲（生産予定の有無によらない）を返す
+
+        Args:
+            header (Sequence[Any]): data_rows()のヘッダー
+            layout (ScheduleLayout): シートのレイアウト
+            dates (DateRange): 読み込む期間（指定した場合は日付列との重なり）
+
+        Returns:
+            Optional[Tuple[date, date]]: (最初の日付, 最後の日付)。日付列がない場合はNone
+        """
+        start, end = ScheduleRecords._date_range(dates)
+        days = [
+            _to_date(header[j])
+            for j in layout.date_columns
+            if ScheduleRecords._in_date_range(header[j], start, end)
+        ]
+        days = [day for day in days if day is not None]
+        if not days:
+            return None
+        return min(days), max(days)
+
+    @staticmethod
+    def parse(
+        header: Sequence[Any],
+        data: Sequence[Sequence[Any]],
+        layout: ScheduleLayout,
+        line_code: str,
+        fields: Optional[Sequence[str]] = None,
+        dates: DateRange = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        データ行から指図ごとのレコードを生成する
+
+        Args:
+            header (Sequence[Any]): data_rows()のヘッダー
+            data (Sequence[Sequence[Any]]): data_rows()のデータ行
+            layout (ScheduleLayout): シートのレイアウト
+            line_code (str): ライン識別コード
+            fields (Optional[Sequence[str]]): 出力する項目（省略時は全項目）
+            dates (DateRange): 生産予定を読み込む期間 (開始日, 終了日)。1日だけの場合は日付を指定する
+
+        Returns:
+            List[Dict[str, Any]]: 期間内に生産予定がある指図のレコード
+        """
+        columns = ScheduleRecords.select_fields(fields)
+        col: Dict[str, int] = {}
+        for j, label in enumerate(header):
+            if isinstance(label, str):
+                col.setdefault(label, j)
+
+        # 読み込む項目と日付列を絞り込む
+        lot_row_fields = {
+            name: read
+            for name, read in ScheduleRecords.LOT_ROW_FIELDS.items()
+            if name in columns
+        }
+        board_row_fields = {
+            name: read
+            for name, read in ScheduleRecords.BOARD_ROW_FIELDS.items()
+            if name in columns
+        }
+        start, end = ScheduleRecords._date_range(dates)
+        date_columns = [
+            (j, header[j])
+            for j in layout.date_columns
+            if ScheduleRecords._in_date_range(header[j], start, end)
+        ]
+        defaults = vars(LotInfo())
+        defaults["machine_name"] = line_code.split(".")[0]
+
+        i = 0
+        records: Dict[Any, Dict[str, Any]] = {}
+        for index, row in enumerate(data):
+            if i == 0:
+                record = {name: defaults[name] for name in columns}
+                productions: Dict[Any, Any] = {}
+                lot_number = defaults["lot_number"]
+            try:
+                # rowが偶数行なら指図行
+                if index % 2 == 0:
+                    # すでに追加済みの指図の場合スキップ
+                    if row[col["指図－工程"]] in records:
+                        i = 0
+                        continue
+                    lot_number = row[col["指図－工程"]]
+                    if "lot_number" in record:
+                        record["lot_number"] = lot_number
+                    for name, read in lot_row_fields.items():
+                        record[name] = read(row, col, layout)
+                    i += 1
+                    # 生産計画を読み込む
+                    for j, label in date_columns:
+                        if not _is_blank(row[j]):
+                            productions[label] = row[j]
+                # rowが奇数行なら基板行
+                else:
+                    for name, read in board_row_fields.items():
+                        record[name] = read(row, col, layout)
+                    i += 1
+                if i == 2:
+                    if len(productions) > 0:
+                        if "productions" in record:
+                            record["productions"] = productions
+                        records[lot_number] = record
+                    i = 0
+            except Exception as e:
+                print(f"行の処理中にエラーが発生しました (行番号: {index + 1}): {e}")
+                continue
+        return list(records.values())
+
+    @staticmethod
+    def load_sheet(
+        dir_path: str, line_code: str
+    ) -> Tuple[List[Any], List[List[Any]], ScheduleLayout]:
+        """
+        ラインのExcelファイルを読み込み、ヘッダー・データ行・レイアウトを返す
+        .xlsx と .xls のどちらもiter_rows()で1行ずつ読み込み、指図行・基板行だけを保持する
+
+        Args:
+            dir_path (str): Excelファイルが格納されているディレクトリパス
+            line_code (str): ライン識別コード
+
+        Returns:
+            Tuple[List[Any], List[List[Any]], ScheduleLayout]:
+                data_rows()のヘッダーとデータ行、シートのレイアウト
+        """
+        path = ScheduleRecords.resolve_path(dir_path, line_code)
+        with closing(ScheduleRecords.iter_rows(path)) as rows:
+            # pd.read_excelと同じ行位置にするため1行目を除く
+            next(rows, None)
+            # シート先頭からレイアウトを検出（同じレイアウトはキャッシュを使用）
+            head = list(islice(rows, ScheduleLayout.SEARCH_ROWS))
+            layout = ScheduleLayout.resolve(head)
+            # 残りの行は読み込みながら絞り込む
+            header, data = ScheduleRecords.data_rows(chain(head, rows), layout)
+        return header, data, layout
+
+    @staticmethod
+    def get_lot_records(
+        dir_path: str,
+        line_code: str,
+        fields: Optional[Sequence[str]] = None,
+        dates: DateRange = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        ExcelファイルのアクティブシートからLotInfoのレコードを生成する
+        get_lot_infoと同じ内容をpandasを使わずに返す
+
+        Args:
+            dir_path (str): Excelファイルが格納されているディレクトリパス
+            line_code (str): ライン識別コード
+            fields (Optional[Sequence[str]]): 出力するLotInfoの項目（省略時は全項目）
+            dates (DateRange): 生産予定を読み込む期間 (開始日, 終了日)
+
+        Returns:
+            List[Dict[str, Any]]: LotInfoの項目をキーとするレコードのリスト
+        """
+        columns = ScheduleRecords.select_fields(fields)
+        ScheduleRecords._date_range(dates)
+        header, data, layout = ScheduleRecords.load_sheet(dir_path, line_code)
+        return ScheduleRecords.parse(header, data, layout, line_code, columns, dates)
+
+    @staticmethod
+    def get_all_lot_records(
+        dir_path: str,
+        start_line: int,
+        end_line: int,
+        fields: Optional[Sequence[str]] = None,
+        dates: DateRange = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        指定された範囲のラインのレコードを連結して返す（get_lot_infosと同じ範囲）
+
+        Args:
+            dir_path (str): Excelファイルが格納されているディレクトリパス
+            start_line (int): 開始ライン番号
+            end_line (int): 終了ライン番号
+            fields (Optional[Sequence[str]]): 出力するLotInfoの項目（省略時は全項目）
+            dates (DateRange): 生産予定を読み込む期間 (開始日, 終了日)
+
+        Returns:
+            List[Dict[str, Any]]: 全ラインのレコード
+        """
+        columns = ScheduleRecords.select_fields(fields)
+        ScheduleRecords._date_range(dates)
+        records: List[Dict[str, Any]] = []
+        for code in range(start_line, end_line + 1):
+            line_code = f"GC{code:02d}"
+            try:
+                records += ScheduleRecords.get_lot_records(
+                    dir_path, line_code, columns, dates
+                )
+            except FileNotFoundError:
+                print(f"ファイルが見つかりません: {line_code}")
+                continue
+            except Exception as e:
+                print(f"エラーが発生しました ({line_code}): {e}")
+                continue
+        return records
+
+    @staticmethod
+    def to_columns(
+        records: Sequence[Dict[str, Any]], fields: Optional[Sequence[str]] = None
+    ):
+        """
+        レコードを項目ごとのNumPy配列に変換する
+        NUMERIC_FIELDSはfloat64（数値でない値はNaN）、その他はobject配列とする
+
+        Args:
+            records (Sequence[Dict[str, Any]]): レコード
+            fields (Optional[Sequence[str]]): 項目（省略時は先頭レコードの項目）
+
+        Returns:
+            Dict[str, np.ndarray]: 項目をキーとする配列
+        """
+        import numpy as np
+
+        if fields is None:
+            fields = list(records[0]) if records else ScheduleRecords.FIELDS
+        columns = {}
+        for name in fields:
+            values = [record.get(name) for record in records]
+            if name in ScheduleRecords.NUMERIC_FIELDS:
+                columns[name] = np.array(
+                    [_to_number(value) for value in values], dtype=float
+                )
+            else:
+                array = np.empty(len(values), dtype=object)
+                array[:] = values
+                columns[name] = array
+        return columns
+
+    @staticmethod
+    def to_frame(
+        records: Sequence[Dict[str, Any]], fields: Optional[Sequence[str]] = None
+    ):
+        """
+        レコードをget_lot_infoと同じ形式のDataFrameに変換する
+
+        Args:
+            records (Sequence[Dict[str, Any]]): レコード
+            fields (Optional[Sequence[str]]): 列（省略時は先頭レコードの項目）
+
+        Returns:
+            pd.DataFrame: レコードのDataFrame（レコードがない場合は空のDataFrame）
+        """
+        import pandas as pd
+
+        if not records:
+            return pd.DataFrame()
+        return pd.DataFrame(list(records), columns=fields or list(records[0]))
+
+    @staticmethod
+    def to_ndjson(
+        records: Sequence[Dict[str, Any]], fp: Optional[IO[str]] = None
+    ) -> Optional[str]:
+        """
+        レコードをNDJSON（1行1レコードのJSON）に変換する
+        日付はISO形式、生産予定は日付文字列をキーとするオブジェクト、NaNはnullとする
+
+        Args:
+            records (Sequence[Dict[str, Any]]): レコード
+            fp (Optional[IO[str]]): 出力先（省略時は文字列を返す）
+
+        Returns:
+            Optional[str]: fpを省略した場合はNDJSON文字列
+        """
+        lines = (
+            json.dumps(_jsonable(record), ensure_ascii=False) + "\n"
+            for record in records
+        )
+        if fp is None:
+            return "".join(lines)
+        fp.writelines(lines)
+        return None
+
+    @staticmethod
+    def to_db_insert(
+        records: Sequence[Dict[str, Any]],
+        table: str,
+        fields: Optional[Sequence[str]] = None,
+        paramstyle: str = "qmark",
+    ) -> Tuple[str, List[Any]]:
+        """
+        レコードをDB-APIのexecutemany()に渡すINSERT文とパラメーターに変換する
+        生産予定はJSON文字列、NaNはNULLとする
+
+        Example:
+            cursor.executemany(*ScheduleRecords.to_db_insert(records, "lots"))
+
+        Args:
+            records (Sequence[Dict[str, Any]]): レコード
+            table (str): 登録先のテーブル名（英数字と_、スキーマ名.テーブル名も可）
+            fields (Optional[Sequence[str]]): 登録する項目（FIELDSのいずれか。省略時は先頭レコードの項目）
+            paramstyle (str): DBドライバーのparamstyle（PARAMSTYLESのいずれか）
+
+        Returns:
+            Tuple[str, List[Any]]: INSERT文と、レコードごとのパラメーター
+                （named / pyformat は辞書、それ以外はタプル）
+        """
+        if paramstyle not in ScheduleRecords.PARAMSTYLES:
+            raise ValueError(f"対応していないparamstyleです: {paramstyle}")
+        # SQL文に埋め込むため、テーブル名と項目は識別子として検証する
+        if not isinstance(table, str) or not _TABLE_PATTERN.match(table):
+            raise ValueError(f"テーブル名に使用できない文字が含まれています: {table!r}")
+        if fields is None:
+            fields = list(records[0]) if records else ScheduleRecords.FIELDS
+        fields = list(fields)
+        ScheduleRecords.select_fields(fields)
+
+        placeholders = {
+            "qmark": ["?"] * len(fields),
+            "numeric": [f":{n}" for n in range(1, len(fields) + 1)],
+            "named": [f":{name}" for name in fields],
+            "format": ["%s"] * len(fields),
+            "pyformat": [f"%({name})s" for name in fields],
+        }[paramstyle]
+        sql = (
+            f"INSERT INTO {table} ({', '.join(fields)}) "
+            f"VALUES ({', '.join(placeholders)})"
+        )
+
+        params: List[Any] = []
+        for record in records:
+            values = [ScheduleRecords._db_value(record.get(name)) for name in fields]
+            if paramstyle in ("named", "pyformat"):
+                params.append(dict(zip(fields, values)))
+            else:
+                params.append(tuple(values))
+        return sql, params
+
+    @staticmethod
+    def _db_value(value: Any) -> Any:
+        """DBに登録する値に変換する"""
+        if isinstance(value, dict):
+            return json.dumps(_jsonable(value), ensure_ascii=False)
+        if _is_blank(value):
+            return None
+        if hasattr(value, "item"):
+            return value.item()
+        return value
+
+    @staticmethod
+    def _date_range(dates: DateRange) -> Tuple[Optional[date], Optional[date]]:
+        """
+        期間の指定を (開始日, 終了日) に正規化する
+        期間はタプル・リストの (開始日, 終了日) か1日の日付で、Noneの端は制限しない
+
+        Raises:
+            ValueError: 期間の要素数が2でない場合や、日付に変換できない場合
+        """
+        if dates is None:
+            return None, None
+        if isinstance(dates, (tuple, list)):
+            if len(dates) != 2:
+                raise ValueError(f"期間は (開始日, 終了日) で指定してください: {dates!r}")
+        else:
+            dates = (dates, dates)
+        bounds = []
+        for value in dates:
+            day = _to_date(value) if value is not None else None
+            if value is not None and day is None:
+                raise ValueError(f"日付に変換できません: {value!r}")
+            bounds.append(day)
+        return bounds[0], bounds[1]
+
+    @staticmethod
+    def _in_date_range(label: Any, start: Optional[date], end: Optional[date]) -> bool:
+        """日付列のラベルが期間内かどうかを判定する"""
+        if start is None and end is None:
+            return True
+        day = _to_date(label)
+        if day is None:
+            return False
+        return (start is None or start <= day) and (end is None or day <= end)
+
+    @staticmethod
+    def _iter_xlsx(path: str) -> Iterator[Sequence[Any]]:
+        """openpyxlの読み取り専用モードで最初のシートの行を1行ずつ返す"""
+        try:
+            import openpyxl
+        except ImportError:
+            raise ImportError(
+                ".xlsx の読み込みにはopenpyxlが必要です: pip install ktec_smt_schedule[xlsx]"
+            )
+
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _iter_xls(path: str) -> Iterator[Sequence[Any]]:
+        """xlrdで最初のシートの行を1行ずつ返す（日付は日時、整数値はintに変換）"""
+        import xlrd
+
+        book = xlrd.open_workbook(path, on_demand=True)
+        try:
+            sheet = book.sheet_by_index(0)
+            for r in range(sheet.nrows):
+                row = []
+                for cell in sheet.row(r):
+                    if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+                        row.append(None)
+                    elif cell.ctype == xlrd.XL_CELL_ERROR:
+                        row.append(None)
+                    elif cell.ctype == xlrd.XL_CELL_DATE:
+                        row.append(xlrd.xldate_as_datetime(cell.value, book.datemode))
+                    elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
+                        row.append(bool(cell.value))
+                    elif cell.ctype == xlrd.XL_CELL_NUMBER and cell.value.is_integer():
+                        # pd.read_excelと同様に整数値はintとする
+                        row.append(int(cell.value))
+                    else:
+                        row.append(cell.value)
+                yield row
+        finally:
+            book.release_resources()
@@ -0,0 +1,206 @@
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .smt_schedule import SMTSchedule
+
+
+class SetupFamily:
+    """
+    指図を段取りファミリーにまとめ、ラインごとの切替回数とコストを求める
+
+    ファミリーはキー列（既定は基板名とY番）の組み合わせで決まり、
+    barcode_model.csv を指定した場合はモデル・基板に対応するバーコード区分もキーに加える。
+    キーはハッシュ値(family_key)に変換し、ソートと隣接比較でまとめて処理する。
+    """
+
+    DEFAULT_KEYS = ("board_name", "model_code")
+    "**既定のファミリーキー列**"
+
+    SEQUENCE_COLUMNS = [
+        "machine_name",
+        "lot_number",
+        "family",
+        "family_key",
+        "first_date",
+        "changeover",
+        "changeover_cost",
+    ]
+    "**sequence()の列**"
+
+    @staticmethod
+    def assign(
+        df: pd.DataFrame,
+        keys: Sequence[str] = DEFAULT_KEYS,
+        barcode_path: Optional[str] = None,
+        encoding: str = "cp932",
+    ) -> pd.DataFrame:
+        """
+        各指図にファミリーを割り当てる
+
+        Args:
+            df (pd.DataFrame): get_lot_infosの結果
+            keys (Sequence[str]): ファミリーを決める列
+            barcode_path (Optional[str]): model, board, barcode列を持つCSVのパス
+            encoding (str): barcode_pathのエンコーディング
+
+        Returns:
+            pd.DataFrame: family（キーの文字列）とfamily_key（ハッシュ値）列を追加したDataFrame
+        """
+        df = df.copy()
+        if df.empty:
+            return df.assign(
+                family=pd.Series(dtype=str), family_key=pd.Series(dtype="uint64")
+            )
+        keys = list(keys)
+        if barcode_path is not None:
+            barcode = pd.read_csv(barcode_path, encoding=encoding, dtype=str)
+            barcode = barcode.drop_duplicates(["model", "board"])
+            index = pd.MultiIndex.from_frame(barcode[["model", "board"]])
+            lookup = pd.MultiIndex.from_arrays(
+                [df["model_name"].astype(str), df["board_name"].astype(str)]
+            )
+            position = index.get_indexer(lookup)
+            values = barcode["barcode"].to_numpy(dtype=object)
+            df["barcode"] = np.where(position >= 0, values[position], "")
+            keys.append("barcode")
+
+        key_frame = df[keys].fillna("").astype(str)
+        df["family"] = key_frame.iloc[:, 0].str.cat(
+            [key_frame[key] for key in keys[1:]], sep="|"
+        )
+        df["family_key"] = pd.util.hash_pandas_object(
+            key_frame, index=False
+        ).to_numpy()
+        return df
+
+    @staticmethod
+    def sequence(df: pd.DataFrame, default_cost: float = 0.0) -> pd.DataFrame:
+        """
+        現在の日別の並びで各ラインの指図を並べ、切替の発生とコストを求める
+
+        各指図の最初の生産日と元の並び順で並べ、直前の指図とファミリーが異なる場合を切替とする。
+        切替コストは切り替え後の指図の切替時間(changeover_time)、0の場合はdefault_costとする。
+
+        Args:
+            df (pd.DataFrame): assign()の結果
+            default_cost (float): 切替時間がない指図の切替コスト
+
+        Returns:
+            pd.DataFrame: SEQUENCE_COLUMNSの列を持つ、ライン・生産順に並んだDataFrame
+        """
+        seq = SetupFamily._ordered(df, default_cost)
+        if seq.empty:
+            return pd.DataFrame(columns=SetupFamily.SEQUENCE_COLUMNS)
+        return SetupFamily._mark_changeovers(seq)[SetupFamily.SEQUENCE_COLUMNS]
+
+    @staticmethod
+    def summary(df: pd.DataFrame, default_cost: float = 0.0) -> pd.DataFrame:
+        """
+        ラインごとの切替回数・コストと、ファミリー単位にまとめた場合の切替回数を返す
+
+        Args:
+            df (pd.DataFrame): assign()の結果
+            default_cost (float): 切替時間がない指図の切替コスト
+
+        Returns:
+            pd.DataFrame: machine_name, lots, families, changeovers, changeover_cost,
+                batched_changeovers列を持つDataFrame
+        """
+        columns = [
+            "machine_name",
+            "lots",
+            "families",
+            "changeovers",
+            "changeover_cost",
+            "batched_changeovers",
+        ]
+        seq = SetupFamily.sequence(df, default_cost)
+        if seq.empty:
+            return pd.DataFrame(columns=columns)
+        summary = seq.groupby("machine_name", sort=True).agg(
+            lots=("lot_number", "size"),
+            families=("family_key", "nunique"),
+            changeovers=("changeover", "sum"),
+            changeover_cost=("changeover_cost", "sum"),
+        )
+        summary["batched_changeovers"] = summary["families"] - 1
+        return summary.reset_index()[columns]
+
+    @staticmethod
+    def suggest_order(df: pd.DataFrame, default_cost: float = 0.0) -> pd.DataFrame:
+        """
+        ラインごとに同じファミリーの指図を連続させた並び順を提案する
+
+        ファミリーは最も早い生産日の順に並べ、ファミリー内は現在の順序を保つ。
+        基準日は考慮しないため、DueDateAnalyzerで遅れを確認してから採用すること。
+
+        Args:
+            df (pd.DataFrame): assign()の結果
+            default_cost (float): 切替時間がない指図の切替コスト
+
+        Returns:
+            pd.DataFrame: SEQUENCE_COLUMNSの列（切替は提案順で数え直す）に
+                current_rank と suggested_rank を加え、提案順に並べたDataFrame
+        """
+        columns = SetupFamily.SEQUENCE_COLUMNS + ["current_rank", "suggested_rank"]
+        seq = SetupFamily._ordered(df, default_cost)
+        if seq.empty:
+            return pd.DataFrame(columns=columns)
+        seq["current_rank"] = seq.groupby("machine_name").cumcount()
+        seq["family_first"] = seq.groupby(["machine_name", "family_key"])[
+            "first_date"
+        ].transform("min")
+        seq = seq.sort_values(
+            ["machine_name", "family_first", "family_key", "current_rank"],
+            kind="stable",
+        ).reset_index(drop=True)
+        seq["suggested_rank"] = seq.groupby("machine_name").cumcount()
+        return SetupFamily._mark_changeovers(seq)[columns]
+
+    @staticmethod
+    def _ordered(df: pd.DataFrame, default_cost: float) -> pd.DataFrame:
+        """指図を最初の生産日・元の並び順でラインごとに並べる（cost列は切替コスト）"""
+        if df.empty:
+            return pd.DataFrame(
+                columns=["machine_name", "lot_number", "family", "family_key"]
+                + ["first_date", "position", "cost"]
+            )
+
+        long_df = SMTSchedule.explode_productions(df, with_position=True)
+        long_df = long_df[long_df["quantity"] > 0]
+        first_date = long_df.groupby("position")["date"].min().reindex(range(len(df)))
+
+        if "changeover_time" in df.columns:
+            cost = pd.to_numeric(df["changeover_time"], errors="coerce").fillna(0.0)
+            cost = cost.to_numpy(dtype=float)
+        else:
+            cost = np.zeros(len(df))
+
+        seq = pd.DataFrame(
+            {
+                "machine_name": df["machine_name"].to_numpy(),
+                "lot_number": df["lot_number"].to_numpy(),
+                "family": df["family"].to_numpy(),
+                "family_key": df["family_key"].to_numpy(),
+                "first_date": first_date.to_numpy(),
+                "position": np.arange(len(df)),
+                "cost": np.where(cost > 0, cost, default_cost),
+            }
+        )
+        seq = seq[seq["first_date"].notna()]
+        return seq.sort_values(
+            ["machine_name", "first_date", "position"], kind="stable"
+        ).reset_index(drop=True)
+
+    @staticmethod
+    def _mark_changeovers(seq: pd.DataFrame) -> pd.DataFrame:
+        """同じラインで直前の指図とファミリーが異なる行を切替とする"""
+        line = seq["machine_name"].to_numpy()
+        family_key = seq["family_key"].to_numpy()
+        same_line = np.r_[False, line[1:] == line[:-1]]
+        changeover = same_line & np.r_[False, family_key[1:] != family_key[:-1]]
+        seq = seq.assign(changeover=changeover)
+        seq["changeover_cost"] = np.where(changeover, seq["cost"].to_numpy(), 0.0)
+        return seq
@@ -0,0 +1,223 @@
+import json
+import os
+import shutil
+import uuid
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .smt_schedule import SMTSchedule
+
+
+class SharedScheduleCache:
+    """
+    解析済みスケジュールをメモリマップ可能な列ファイルとして共有するキャッシュ
+
+    publish()でget_lot_infosの結果を世代ディレクトリ（gen-000001 など）に
+    列ごとの .npy ファイルとして書き出し、CURRENTファイルを差し替えて公開する。
+    各ワーカーはattach()で現在の世代を mmap_mode="r" で読み込むため、
+    データはOSのページキャッシュを通じてプロセス間で共有される。
+
+    Attributes:
+        cache_dir (str): キャッシュディレクトリ
+        generation (Optional[str]): アタッチ中の世代名
+        lots (Dict[str, np.ndarray]): 指図ごとの列配列（productions列を除く）
+        productions (Dict[str, np.ndarray]): lot_index, date, quantity の縦持ち配列
+    """
+
+    CURRENT_FILE = "CURRENT"
+    META_FILE = "meta.json"
+    PRODUCTION_COLUMNS = ["lot_index", "date", "quantity"]
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir (str): キャッシュディレクトリ（存在しない場合は作成する）
+        """
+        self.cache_dir = cache_dir
+        self.generation: Optional[str] = None
+        self.lots: Dict[str, np.ndarray] = {}
+        self.productions: Dict[str, np.ndarray] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def publish(self, df: pd.DataFrame, keep: int = 2) -> str:
+        """
+        LotInfo DataFrameを新しい世代として書き出し、アトミックに公開する
+
+        Args:
+            df (pd.DataFrame): get_lot_infosの結果
+            keep (int): 残しておく世代数（アタッチ中のワーカーのため古い世代も保持する）
+
+        Returns:
+            str: 公開した世代名
+        """
+        if keep < 1:
+            raise ValueError(f"keepは1以上を指定してください: {keep}")
+        generation = self._next_generation()
+        tmp_dir = os.path.join(self.cache_dir, f".tmp-{uuid.uuid4().hex}")
+        os.makedirs(tmp_dir)
+        try:
+            lot_columns = [c for c in df.columns if c != "productions"]
+            meta = {"lot_columns": lot_columns, "rows": len(df)}
+            for column in lot_columns:
+                np.save(
+                    os.path.join(tmp_dir, f"lots.{column}.npy"),
+                    self._to_array(df[column]),
+                )
+
+            # 縦持ちデータは行番号で指図と結び付ける
+            long_df = SMTSchedule.explode_productions(df, with_position=True)
+            arrays = {
+                "lot_index": long_df["position"].to_numpy(dtype=np.int64),
+                "date": long_df["date"].to_numpy(dtype="datetime64[D]"),
+                "quantity": long_df["quantity"].to_numpy(dtype=np.float64),
+            }
+            for column, array in arrays.items():
+                np.save(os.path.join(tmp_dir, f"productions.{column}.npy"), array)
+
+            meta_path = os.path.join(tmp_dir, self.META_FILE)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+
+            os.rename(tmp_dir, os.path.join(self.cache_dir, generation))
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        self._write_current(generation)
+        self._cleanup(keep)
+        return generation
+
+    def attach(self) -> str:
+        """
+        現在公開されている世代をゼロコピーでアタッチする
+
+        Returns:
+            str: アタッチした世代名
+        """
+        generation = self.current_generation()
+        if generation is None:
+            raise FileNotFoundError(
+                f"公開済みのキャッシュが存在しません: {self.cache_dir}"
+            )
+        gen_dir = os.path.join(self.cache_dir, generation)
+        with open(os.path.join(gen_dir, self.META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+
+        self.lots = {
+            column: np.load(os.path.join(gen_dir, f"lots.{column}.npy"), mmap_mode="r")
+            for column in meta["lot_columns"]
+        }
+        self.productions = {
+            column: np.load(
+                os.path.join(gen_dir, f"productions.{column}.npy"), mmap_mode="r"
+            )
+            for column in self.PRODUCTION_COLUMNS
+        }
+        self.generation = generation
+        return generation
+
+    def refresh(self) -> bool:
+        """
+        新しい世代が公開されていれば切り替える
+
+        Returns:
+            bool: 世代を切り替えた場合True
+        """
+        generation = self.current_generation()
+        if generation is None or generation == self.generation:
+            return False
+        self.attach()
+        return True
+
+    def current_generation(self) -> Optional[str]:
+        """
+        公開中の世代名を返す
+
+        Returns:
+            Optional[str]: 世代名（未公開ならNone）
+        """
+        path = os.path.join(self.cache_dir, self.CURRENT_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip() or None
+
+    def lots_frame(self) -> pd.DataFrame:
+        """
+        アタッチ中の指図情報をDataFrameとして返す（文字列列はコピーされる）
+
+        Returns:
+            pd.DataFrame: productions列を除くLotInfo情報
+        """
+        return pd.DataFrame({column: array for column, array in self.lots.items()})
+
+    def productions_frame(self) -> pd.DataFrame:
+        """
+        アタッチ中の生産予定を縦持ちDataFrameとして返す
+
+        Returns:
+            pd.DataFrame: lot_number, machine_name, date, quantity列を持つDataFrame
+        """
+        lot_index = np.asarray(self.productions["lot_index"])
+        columns = {}
+        for column in ("lot_number", "machine_name"):
+            if column in self.lots:
+                columns[column] = np.asarray(self.lots[column])[lot_index]
+            else:
+                # 空のDataFrameを公開した世代には指図の列がない
+                columns[column] = np.full(len(lot_index), "", dtype=np.str_)
+        columns["date"] = np.asarray(self.productions["date"]).astype("datetime64[ns]")
+        columns["quantity"] = self.productions["quantity"]
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def _to_array(series: pd.Series) -> np.ndarray:
+        """Seriesをmmap可能な固定長の配列に変換する（object配列は使わない）"""
+        if pd.api.types.is_bool_dtype(series):
+            return series.to_numpy(dtype=np.bool_)
+        if pd.api.types.is_numeric_dtype(series):
+            return series.to_numpy(dtype=np.float64)
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series.to_numpy(dtype="datetime64[D]")
+        values = series.dropna()
+        if len(values) > 0 and all(
+            isinstance(v, (date, np.datetime64)) for v in values
+        ):
+            return pd.to_datetime(series).to_numpy(dtype="datetime64[D]")
+        if len(values) > 0 and all(
+            isinstance(v, (int, float, np.number)) and not isinstance(v, bool)
+            for v in values
+        ):
+            return pd.to_numeric(series).to_numpy(dtype=np.float64)
+        return series.fillna("").astype(str).to_numpy(dtype=np.str_)
+
+    def _generations(self) -> List[str]:
+        """世代ディレクトリ名を古い順に返す"""
+        return sorted(
+            entry.name
+            for entry in os.scandir(self.cache_dir)
+            if entry.is_dir() and entry.name.startswith("gen-")
+        )
+
+    def _next_generation(self) -> str:
+        """次の世代名を返す"""
+        generations = self._generations()
+        number = int(generations[-1][4:]) + 1 if generations else 1
+        return f"gen-{number:06d}"
+
+    def _write_current(self, generation: str):
+        """CURRENTファイルを一時ファイル経由で置き換える"""
+        tmp_path = os.path.join(
+            self.cache_dir, f".{self.CURRENT_FILE}.{uuid.uuid4().hex}"
+        )
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(generation)
+        os.replace(tmp_path, os.path.join(self.cache_dir, self.CURRENT_FILE))
+
+    def _cleanup(self, keep: int):
+        """古い世代を削除する（Windowsでmmap中のファイルは削除できないため失敗は無視する）"""
+        for generation in self._generations()[:-keep]:
+            shutil.rmtree(os.path.join(self.cache_dir, generation), ignore_errors=True)
@@ -0,0 +1,222 @@
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .smt_schedule import SMTSchedule
+
+
+class ShiftCalendar:
+    """
+    ラインのシフトカレンダー
+
+    1日のシフトを (シフト名, 稼働秒数) のリストで表す。
+    ライン別のシフトと休日を指定でき、休日にはシフトを割り当てない。
+
+    Example:
+        ShiftCalendar(
+            [("day", 8 * 3600), ("night", 8 * 3600), ("overtime", 2 * 3600)],
+            line_shifts={"GC05": [("day", 8 * 3600)]},
+            holidays=[date(2025, 10, 13)],
+        )
+    """
+
+    def __init__(
+        self,
+        shifts: List[Tuple[str, float]],
+        line_shifts: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+        holidays: Iterable[date] = (),
+    ):
+        """
+        Args:
+            shifts (List[Tuple[str, float]]): 全ライン共通のシフト
+            line_shifts (Optional[Dict[str, List[Tuple[str, float]]]]): ライン別のシフト
+            holidays (Iterable[date]): 休日
+        """
+        self.shifts = list(shifts)
+        self.line_shifts = dict(line_shifts or {})
+        self.holidays = {pd.Timestamp(day).normalize() for day in holidays}
+        for line, line_shift in [(None, self.shifts)] + list(self.line_shifts.items()):
+            if sum(seconds for _, seconds in line_shift) <= 0:
+                raise ValueError(f"稼働時間のないシフトが指定されています: {line}")
+
+    def shifts_for(self, machine_name: str) -> List[Tuple[str, float]]:
+        """
+        ラインのシフトを返す
+
+        Args:
+            machine_name (str): ライン名
+
+        Returns:
+            List[Tuple[str, float]]: (シフト名, 稼働秒数) のリスト
+        """
+        return self.line_shifts.get(machine_name, self.shifts)
+
+    def is_holiday(self, day: pd.Timestamp) -> bool:
+        """
+        休日かどうかを返す
+
+        Args:
+            day (pd.Timestamp): 日付
+
+        Returns:
+            bool: 休日ならTrue
+        """
+        return day in self.holidays
+
+
+class ShiftPlanner:
+    """日別の生産予定をタクトとシフトカレンダーからシフト別の目標数に展開する"""
+
+    COLUMNS = ["machine_name", "lot_number", "date", "work_date", "shift", "quantity"]
+
+    @staticmethod
+    def expand(
+        df: pd.DataFrame, calendar: ShiftCalendar, default_tact: float = 0.0
+    ) -> pd.DataFrame:
+        """
+        get_lot_infosの結果をシフト別の生産目標に展開する
+
+        各ラインで指図を日付・元の並び順に並べ、数量×タクトの作業時間をシフトに順に詰める。
+        シフトに収まらない分は次のシフト（最終シフトの場合は翌稼働日）に繰り越す。
+        全ラインを1本の時間軸に並べ、累積和と累積最大値で一括して割り当てる。
+
+        Args:
+            df (pd.DataFrame): get_lot_infosの結果（tact列を使用）
+            calendar (ShiftCalendar): シフトカレンダー
+            default_tact (float): タクトが0または欠損の指図に使うタクト（秒/台）
+
+        Returns:
+            pd.DataFrame: machine_name, lot_number, date（計画日）, work_date（稼働日）,
+                shift, quantity列を持つDataFrame
+        """
+        if df.empty:
+            return pd.DataFrame(columns=ShiftPlanner.COLUMNS)
+
+        # 縦持ちに展開し、元の行位置からタクトを引く
+        long_df = SMTSchedule.explode_productions(df, with_position=True)
+        if "tact" in df.columns:
+            tact = pd.to_numeric(df["tact"], errors="coerce").to_numpy(dtype=float)
+        else:
+            tact = np.zeros(len(df))
+        tact = np.where(np.isnan(tact) | (tact <= 0), default_tact, tact)
+        long_df["tact"] = tact[long_df["position"].to_numpy()]
+        long_df = long_df[long_df["quantity"] > 0]
+        if long_df.empty:
+            return pd.DataFrame(columns=ShiftPlanner.COLUMNS)
+
+        # ライン（出現順）→ 日付 → 元の並び順
+        line_codes, lines = pd.factorize(long_df["machine_name"])
+        long_df["line_code"] = line_codes
+        long_df = long_df.sort_values(
+            ["line_code", "date", "position"], kind="stable"
+        ).reset_index(drop=True)
+
+        quantity = long_df["quantity"].to_numpy(dtype=float)
+        work = quantity * long_df["tact"].to_numpy(dtype=float)
+
+        # シフト枠を全ライン分並べた時間軸を作る
+        slots, releases = ShiftPlanner._build_slots(long_df, lines, work, calendar)
+        slot_end = np.cumsum(slots["seconds"].to_numpy(dtype=float))
+
+        # 各指図の終了時刻: E_i = S_i + max_{k<=i}(R_k - S_{k-1})
+        release = releases.reindex(
+            pd.MultiIndex.from_arrays([long_df["line_code"], long_df["date"]])
+        ).to_numpy(dtype=float)
+        cum_work = np.cumsum(work)
+        end = cum_work + np.maximum.accumulate(release - (cum_work - work))
+        start = end - work
+
+        # 指図×シフト枠の組を一括で作る
+        first = np.searchsorted(slot_end, start, side="right")
+        last = np.maximum(np.searchsorted(slot_end, end, side="left"), first)
+        first = np.minimum(first, len(slot_end) - 1)
+        last = np.minimum(last, len(slot_end) - 1)
+        n_pairs = last - first + 1
+        item = np.repeat(np.arange(len(long_df)), n_pairs)
+        group_start = np.repeat(np.cumsum(n_pairs) - n_pairs, n_pairs)
+        slot = first[item] + (np.arange(len(item)) - group_start)
+
+        # シフト枠の終了時点までに完成した数量の累積から、枠ごとの数量を求める
+        elapsed = np.clip(slot_end[slot] - start[item], 0.0, None)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(work[item] > 0, elapsed / work[item], 1.0)
+        done = np.floor(np.clip(ratio, 0.0, 1.0) * quantity[item] + 1e-9)
+        is_last = np.r_[item[1:] != item[:-1], True]
+        done = np.where(is_last, quantity[item], done)
+        is_first = np.r_[True, item[1:] != item[:-1]]
+        allocated = np.where(is_first, done, done - np.r_[0.0, done[:-1]])
+
+        result = pd.DataFrame(
+            {
+                "machine_name": long_df["machine_name"].to_numpy()[item],
+                "lot_number": long_df["lot_number"].to_numpy()[item],
+                "date": long_df["date"].to_numpy()[item],
+                "work_date": slots["work_date"].to_numpy()[slot],
+                "shift": slots["shift"].to_numpy()[slot],
+                "quantity": allocated,
+            }
+        )
+        return result[result["quantity"] > 0].reset_index(drop=True)
+
+    @staticmethod
+    def _build_slots(
+        long_df: pd.DataFrame,
+        lines: pd.Index,
+        work: np.ndarray,
+        calendar: ShiftCalendar,
+    ) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        全ラインのシフト枠と、(ライン, 日付) ごとの開始位置を返す
+
+        各ラインの枠は、そのラインの作業が繰り越しを含めてすべて収まるまで延長する。
+        """
+        line_codes = long_df["line_code"].to_numpy()
+        work_by_line = np.bincount(line_codes, weights=work, minlength=len(lines))
+        first_dates = long_df.groupby("line_code")["date"].min()
+
+        slot_lines: List[int] = []
+        slot_dates: List[pd.Timestamp] = []
+        slot_shifts: List[str] = []
+        slot_seconds: List[float] = []
+        release_keys: List[Tuple[int, pd.Timestamp]] = []
+        release_values: List[float] = []
+        position = 0.0
+        for code, machine_name in enumerate(lines):
+            shifts = calendar.shifts_for(machine_name)
+            line_dates = long_df.loc[line_codes == code, "date"]
+            last_date = line_dates.max()
+            day = first_dates[code]
+            # 最終日以降の稼働秒数（全作業が最終日に集中しても収まるまで延長する）
+            tail_capacity = 0.0
+            while (
+                day <= last_date
+                or tail_capacity <= 0
+                or tail_capacity < work_by_line[code]
+            ):
+                release_keys.append((code, day))
+                release_values.append(position)
+                if not calendar.is_holiday(day):
+                    for shift, seconds in shifts:
+                        slot_lines.append(code)
+                        slot_dates.append(day)
+                        slot_shifts.append(shift)
+                        slot_seconds.append(seconds)
+                        position += seconds
+                        if day >= last_date:
+                            tail_capacity += seconds
+                day += timedelta(days=1)
+
+        slots = pd.DataFrame(
+            {
+                "line_code": slot_lines,
+                "work_date": slot_dates,
+                "shift": slot_shifts,
+                "seconds": slot_seconds,
+            }
+        )
+        releases = pd.Series(
+            release_values, index=pd.MultiIndex.from_tuples(release_keys)
+        )
+        return slots, releases
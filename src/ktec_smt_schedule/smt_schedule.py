@@ -1,157 +1,264 @@
 import pandas as pd
 import os
-from .lot_info import LotInfo
-from typing import Dict
+import fnmatch
+from datetime import date
+from .records import ScheduleRecords
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from pathlib import Path
 
 
 class SMTSchedule:
 
+    SUPPORT_EXTENSIONS = ScheduleRecords.SUPPORT_EXTENSIONS
+    "**対応するファイル拡張子（優先順）**"
+
+    @staticmethod
+    def resolve_path(dir_path: str, line_code: str) -> str:
+        """
+        ライン識別コードに対応するExcelファイルのパスを返す
+        line_codeに拡張子が含まれない場合は .xlsx → .xls の順に探す
+
+        Args:
+            dir_path (str): Excelファイルが格納されているディレクトリパス
+            line_code (str): ライン識別コード（例: GC01, GC01.xlsx）
+
+        Returns:
+            str: Excelファイルのパス
+        """
+        return ScheduleRecords.resolve_path(dir_path, line_code)
+
     @staticmethod
-    def get_lot_info(dir_path: str, line_code: str) -> pd.DataFrame:
+    def discover_line_codes(
+        dir_path: str, pattern: str = "GC[0-9][0-9].*"
+    ) -> List[str]:
+        """
+        ディレクトリを1回だけ列挙し、パターンに一致するExcelファイル名を返す
+        同じライン識別コードの .xlsx と .xls がある場合はSUPPORT_EXTENSIONSの順で優先する
+
+        Args:
+            dir_path (str): Excelファイルが格納されているディレクトリパス
+            pattern (str): ファイル名のパターン（fnmatch形式）
+
+        Returns:
+            List[str]: 拡張子付きのファイル名（ライン識別コード順）
+        """
+        found: Dict[str, Tuple[int, str]] = {}
+        for entry in os.scandir(dir_path):
+            if not entry.is_file() or not fnmatch.fnmatch(entry.name, pattern):
+                continue
+            stem, ext = os.path.splitext(entry.name)
+            if ext.lower() not in SMTSchedule.SUPPORT_EXTENSIONS:
+                continue
+            priority = SMTSchedule.SUPPORT_EXTENSIONS.index(ext.lower())
+            if stem not in found or priority < found[stem][0]:
+                found[stem] = (priority, entry.name)
+        return [found[stem][1] for stem in sorted(found)]
+
+    @staticmethod
+    def get_lot_info(
+        dir_path: str,
+        line_code: str,
+        output_csv: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        dates: Optional[Union[date, Tuple[Optional[date], Optional[date]]]] = None,
+    ) -> pd.DataFrame:
         """
         ExcelファイルのアクティブシートからLotInfoのDataFrameを生成する
         .xlsx と .xls 形式に対応
 
+        fields / dates を指定した場合は、指定した項目だけを読み込み、指定した期間の日付列だけを走査する。
+        選択した列の内容と型は全項目を読み込んだ場合と同じになる。
+
         Args:
             dir_path (str): Excelファイルが格納されているディレクトリパス
             line_code (str): ライン識別コード
+            output_csv (bool): 中間データをout.csvに出力するかどうか
+            fields (Optional[Sequence[str]]): 出力するLotInfoの項目（省略時は全項目）
+            dates (Optional[Union[date, Tuple[Optional[date], Optional[date]]]]):
+                生産予定を読み込む期間 (開始日, 終了日)。1日だけの場合は日付を指定する
 
         Returns:
             pd.DataFrame: LotInfo情報を含むDataFrame
+                （attrs["horizons"]にライン→日付列の範囲を持つ。get_horizons参照）
         """
+        columns = ScheduleRecords.select_fields(fields)
+        # 不正な期間はファイルを読み込む前にValueErrorとする
+        ScheduleRecords._date_range(dates)
         project_dir = Path(__file__).resolve().parent.parent
 
         try:
-            path = os.path.join(dir_path, f"{line_code}.xls")
-            if not os.path.exists(path):
-                raise FileNotFoundError(f"指定されたファイルが存在しません: {path}")
-            # ファイル拡張子を取得
-            _, ext = os.path.splitext(path)
-            ext = ext.lower()
-
-            support_ext = [".xlsx", ".xls"]
-
-            if ext in support_ext:
-                df = pd.read_excel(path, sheet_name=0)  # 最初のシートを読み取り
-                # dfの8行目をヘッダーに設定
-                df.columns = df.iloc[6, :]
-                # dfから最初の10行を削除
-                df = df.iloc[10:, :].reset_index(drop=True)
-                # dfからA列を削除
-                df = df.iloc[:, 1:]
-                # dfのすべての行を検査してA列が空白の行を削除
-                df = df[df.iloc[:, 0].notna()].reset_index(drop=True)
-                # dfからすべての行を検査してAK列が数値以外の行を削除
-                df = df[
-                    pd.to_numeric(df.iloc[:, 36], errors="coerce").notna()
-                ].reset_index(drop=True)
-
-                # UTF-8-BOMエンコーディングでCSVファイルを出力
-                df.to_csv(
+            # .xlsx / .xls ともScheduleRecordsと同じ読み込み・解析を使う
+            header, data, layout = ScheduleRecords.load_sheet(dir_path, line_code)
+
+            # UTF-8-BOMエンコーディングでCSVファイルを出力
+            if output_csv:
+                pd.DataFrame(data, columns=header).to_csv(
                     Path.joinpath(project_dir, "out.csv").as_posix(),
                     encoding="utf-8-sig",  # UTF-8-BOMエンコーディングを指定
                     index=False,
                 )
 
-                # dfから
-                i = 0
-                lot_info_dict: Dict[str, LotInfo] = {}
-                for index, row in df.iterrows():
-                    if i == 0:
-                        info = LotInfo()
-                        info.machine_name = line_code.split(".")[0]
-                    # rowが偶数行なら
-                    try:
-                        if index % 2 == 0:
-                            # すでに追加済みの指図の場合スキップ
-                            if row["指図－工程"] in lot_info_dict:
-                                i = 0
-                                continue
-                            info.model_name = row["品 目 名 称"]
-                            info.lot_number = row["指図－工程"]
-                            info.default_date = row["基 準"]
-                            info.rest_volume = (
-                                row["前 月 累 計"]
-                                if pd.isna(row["前 月 累 計"] == False)
-                                else 0
-                            )
-                            info.line_code = row["日付"]
-                            info.divisions_volume = (
-                                row["取数"] if row["取数"] != "nan" else 0
-                            )
-                            i += 1
-                            # 生産計画を読み込む
-                            for r in range(7, 30):
-                                column_name = df.columns[r]
-                                if pd.isna(row[column_name]) == False:
-                                    info.productions[column_name] = row[column_name]
-                        # rowが偶数行なら
-                        else:
-                            info.board_name = row["品 目 名 称"].split("/")[0]
-                            info.model_code = row["指図－工程"]
-                            info.volume = (
-                                row["前 月 累 計"] if row["前 月 累 計"] != "nan" else 0
-                            )
-                            i += 1
-                        if i == 2:
-                            if len(info.productions) > 0:
-                                lot_info_dict[info.lot_number] = info
-                            i = 0
-                    except Exception as e:
-                        print(
-                            f"行の処理中にエラーが発生しました (行番号: {index + 1}): {e}"
-                        )
-                        continue
-                # 辞書をDataFrameに変換して返す
-                if lot_info_dict:
-                    return pd.DataFrame([vars(info) for info in lot_info_dict.values()])
-                else:
-                    return pd.DataFrame()
-            else:
-                raise ValueError(
-                    f"サポートされていないファイル形式です: {ext}。.xlsx または .xlsb ファイルを使用してください。"
-                )
+            # 指図ごとのレコードをDataFrameに変換して返す
+            records = ScheduleRecords.parse(
+                header, data, layout, line_code, columns, dates
+            )
+            result = ScheduleRecords.to_frame(records, columns)
+            # 生産予定の有無によらないエクスポートの日付範囲を保持する
+            horizon = ScheduleRecords.horizon(header, layout, dates)
+            if horizon is not None:
+                result.attrs["horizons"] = {
+                    line_code.split(".")[0]: (
+                        pd.Timestamp(horizon[0]),
+                        pd.Timestamp(horizon[1]),
+                    )
+                }
+            return result
 
         except Exception as e:
             raise Exception(f"ファイル読み取りエラー: {str(e)}")
 
     @staticmethod
-    def get_lot_infos(dir_path: str, start_line: int, end_line: int) -> pd.DataFrame:
+    def get_lot_infos(
+        dir_path: str,
+        start_line: int,
+        end_line: int,
+        output_csv: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        dates: Optional[Union[date, Tuple[Optional[date], Optional[date]]]] = None,
+    ) -> pd.DataFrame:
         """
         指定された範囲内で最初に見つかった有効なExcelファイルを読み込み、LotInfoのDataFrameを連結して返す
         UTF-8-BOMエンコーディングでCSVファイルを出力
+
+        Args:
+            dir_path (str): Excelファイルが格納されているディレクトリパス
+            start_line (int): 開始ライン番号
+            end_line (int): 終了ライン番号
+            output_csv (bool): 結果をout.csv / out_all.csvに出力するかどうか
+            fields (Optional[Sequence[str]]): 出力するLotInfoの項目（get_lot_infoと同じ）
+            dates (Optional[Union[date, Tuple[Optional[date], Optional[date]]]]):
+                生産予定を読み込む期間（get_lot_infoと同じ）
+
+        Returns:
+            pd.DataFrame: 全ラインのLotInfo情報を連結したDataFrame
         """
         df_list = []
+        horizons: Dict[str, Tuple[pd.Timestamp, pd.Timestamp]] = {}
         for code in range(start_line, end_line + 1):
             line_code = f"GC{code:02d}"
-            print(f"Processing {line_code}.xls")
+            print(f"Processing {line_code}")
             try:
-                df = SMTSchedule.get_lot_info(dir_path, line_code)
+                df = SMTSchedule.get_lot_info(
+                    dir_path, line_code, output_csv, fields, dates
+                )
+                horizons.update(df.attrs.get("horizons", {}))
                 if not df.empty:
                     df_list.append(df)
             except FileNotFoundError:
-                print(f"ファイルが見つかりません: {line_code}.xls")
+                print(f"ファイルが見つかりません: {line_code}")
                 continue
             except Exception as e:
-                print(f"エラーが発生しました ({line_code}.xls): {e}")
+                print(f"エラーが発生しました ({line_code}): {e}")
                 continue
 
         if df_list:
             combined_df = pd.concat(df_list, ignore_index=True)
 
-            # プロジェクトルートディレクトリを取得
-            project_dir = Path(__file__).resolve().parent.parent
+            if output_csv:
+                # プロジェクトルートディレクトリを取得
+                project_dir = Path(__file__).resolve().parent.parent
+
+                # UTF-8-BOMエンコーディングでout_all.csvファイルを出力
+                combined_df.to_csv(
+                    Path.joinpath(project_dir, "out_all.csv").as_posix(),
+                    encoding="utf-8-sig",  # UTF-8-BOMエンコーディングを指定
+                    index=False,
+                )
+        else:
+            combined_df = pd.DataFrame()
+        combined_df.attrs["horizons"] = horizons
+        return combined_df
+
+    @staticmethod
+    def get_horizons(df: pd.DataFrame) -> Dict[str, Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        ラインごとのエクスポートの日付範囲を返す
+
+        get_lot_info / get_lot_infosが記録した日付列の範囲を使うため、
+        指図がすべて取り消された日も範囲として扱える。
+        範囲が記録されていないラインは、productionsに含まれる日付の最小・最大とする。
+
+        Args:
+            df (pd.DataFrame): get_lot_info / get_lot_infosの結果
 
-            # UTF-8-BOMエンコーディングでout_all.csvファイルを出力
-            combined_df.to_csv(
-                Path.joinpath(project_dir, "out_all.csv").as_posix(),
-                encoding="utf-8-sig",  # UTF-8-BOMエンコーディングを指定
-                index=False,
+        Returns:
+            Dict[str, Tuple[pd.Timestamp, pd.Timestamp]]: ライン → (最初の日付, 最後の日付)
+        """
+        horizons = {
+            machine_name: (
+                pd.Timestamp(start).normalize(),
+                pd.Timestamp(end).normalize(),
             )
+            for machine_name, (start, end) in df.attrs.get("horizons", {}).items()
+        }
+        long_df = SMTSchedule.explode_productions(df)
+        long_df = long_df[long_df["quantity"].notna()]
+        if not long_df.empty:
+            dates = long_df.groupby("machine_name")["date"].agg(["min", "max"])
+            for machine_name, row in dates.iterrows():
+                horizons.setdefault(machine_name, (row["min"], row["max"]))
+        return horizons
+
+    @staticmethod
+    def explode_productions(
+        df: pd.DataFrame, with_position: bool = False
+    ) -> pd.DataFrame:
+        """
+        productions列（日付→数量の辞書）を指図・日付ごとの縦持ちDataFrameに展開する
+        行の順序は元のDataFrameの行順・辞書の順序を保つ
+
+        Args:
+            df (pd.DataFrame): get_lot_info / get_lot_infosの結果
+            with_position (bool): 元のDataFrameの行位置をposition列として付けるかどうか
+
+        Returns:
+            pd.DataFrame: lot_number, machine_name, date, quantity列を持つDataFrame
+        """
+        columns = ["lot_number", "machine_name", "date", "quantity"]
+        if with_position:
+            columns.append("position")
+        if df.empty or "productions" not in df.columns:
+            return pd.DataFrame(columns=columns)
+
+        positions = []
+        lot_numbers = []
+        machine_names = []
+        dates = []
+        quantities = []
+        for position, (lot_number, machine_name, productions) in enumerate(
+            zip(df["lot_number"], df["machine_name"], df["productions"])
+        ):
+            if not isinstance(productions, dict):
+                continue
+            for day, quantity in productions.items():
+                positions.append(position)
+                lot_numbers.append(lot_number)
+                machine_names.append(machine_name)
+                dates.append(day)
+                quantities.append(quantity)
 
-            return combined_df
-        return pd.DataFrame()
+        return pd.DataFrame(
+            {
+                "lot_number": lot_numbers,
+                "machine_name": machine_names,
+                "date": pd.to_datetime(pd.Series(dates, dtype=object)).dt.normalize(),
+                "quantity": pd.to_numeric(
+                    pd.Series(quantities, dtype=object), errors="coerce"
+                ).astype(float),
+                "position": pd.Series(positions, dtype="int64"),
+            },
+            columns=columns,
+        )
 
     @staticmethod
     def read_csv_utf8_bom(file_path: str) -> pd.DataFrame:
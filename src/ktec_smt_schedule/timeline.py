@@ -0,0 +1,160 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .smt_schedule import SMTSchedule
+
+# エクスポートの日付範囲 (開始日, 終了日)
+Horizon = Tuple[date, date]
+
+
+class ScheduleTimeline:
+    """
+    日々のget_lot_infos結果をつなぎ合わせた指図・日付ごとの連続した生産予定
+
+    各エクスポートは基準日(as_of)の前後数週間分しか含まないため、
+    update()で次の規則に従って差分だけを取り込む。
+
+    - as_of より前の日付は実績として確定(frozen)し、以後は上書きしない
+    - as_of 以降の日付は最新のエクスポートで上書きする
+    - 確定済みの日付の列はエクスポートに含まれていても処理しない
+
+    Attributes:
+        frozen_until (Optional[pd.Timestamp]): この日付より前は確定済み
+    """
+
+    COLUMNS = ["lot_number", "machine_name", "date", "quantity", "frozen"]
+
+    def __init__(self):
+        self.frozen_until: Optional[pd.Timestamp] = None
+        self._frozen_chunks: List[pd.DataFrame] = []
+        self._live = pd.DataFrame(columns=self.COLUMNS)
+        self._lots: Dict[Any, Dict[str, Any]] = {}
+        self._columns: List[str] = []
+
+    def update(
+        self,
+        df: pd.DataFrame,
+        as_of: Optional[date] = None,
+        horizon: Optional[Union[Horizon, Dict[str, Horizon]]] = None,
+    ) -> None:
+        """
+        1日分のエクスポートを取り込む
+
+        エクスポートの日付範囲内の予定はエクスポートの内容で置き換えるため、
+        取り消された指図の予定は範囲内から削除される。
+
+        Args:
+            df (pd.DataFrame): get_lot_infosの結果
+            as_of (Optional[date]): エクスポートの基準日（省略時は今日）
+            horizon (Optional[Union[Horizon, Dict[str, Horizon]]]):
+                エクスポートの日付範囲 (開始日, 終了日)。全ライン共通の範囲か、ラインごとの辞書。
+                省略時はSMTSchedule.get_horizons(df)の範囲
+        """
+        as_of = pd.Timestamp(as_of if as_of is not None else date.today()).normalize()
+        if self.frozen_until is not None and as_of < self.frozen_until:
+            raise ValueError(
+                "確定済みの日付より前のエクスポートは取り込めません: "
+                f"{as_of.date()} < {self.frozen_until.date()}"
+            )
+
+        if not df.empty:
+            self._columns = list(df.columns)
+        for record in df.drop(columns=["productions"], errors="ignore").to_dict(
+            "records"
+        ):
+            self._lots[record.get("lot_number")] = record
+
+        long_df = SMTSchedule.explode_productions(df)
+        long_df = long_df[long_df["quantity"].notna()]
+        # 確定済みの日付は処理しない（差分の列のみ）
+        if self.frozen_until is not None:
+            long_df = long_df[long_df["date"] >= self.frozen_until]
+        long_df = long_df.assign(frozen=long_df["date"] < as_of)
+
+        # エクスポートの範囲内にある既存の予定（エクスポートの値で置き換える）
+        live = self._live
+        replaced = self._in_horizon(live, df, horizon)
+
+        # as_of より前になった予定を確定する
+        past_live = live[(live["date"] < as_of) & ~replaced]
+        frozen = self._concat(
+            [past_live.assign(frozen=True), long_df[long_df["frozen"]]]
+        )
+        if not frozen.empty:
+            self._frozen_chunks.append(frozen)
+
+        # as_of 以降はエクスポートの範囲を置き換え、範囲外の予定は残す
+        future_live = live[(live["date"] >= as_of) & ~replaced]
+        self._live = self._concat([long_df[~long_df["frozen"]], future_live])
+        self.frozen_until = as_of
+
+    @staticmethod
+    def _in_horizon(
+        live: pd.DataFrame,
+        df: pd.DataFrame,
+        horizon: Optional[Union[Horizon, Dict[str, Horizon]]],
+    ) -> pd.Series:
+        """既存の予定の各行がエクスポートの日付範囲内かどうかを返す"""
+        if live.empty:
+            return pd.Series(False, index=live.index)
+        if horizon is None:
+            horizon = SMTSchedule.get_horizons(df)
+        if isinstance(horizon, dict):
+            # 範囲のないラインはNaTとなり、範囲外として扱われる
+            starts = {line: pd.Timestamp(s) for line, (s, _) in horizon.items()}
+            ends = {line: pd.Timestamp(e) for line, (_, e) in horizon.items()}
+            start = pd.to_datetime(live["machine_name"].map(starts)).dt.normalize()
+            end = pd.to_datetime(live["machine_name"].map(ends)).dt.normalize()
+        else:
+            start = pd.Timestamp(horizon[0]).normalize()
+            end = pd.Timestamp(horizon[1]).normalize()
+        dates = pd.to_datetime(live["date"])
+        return (dates >= start) & (dates <= end)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        連続した生産予定を縦持ちDataFrameとして返す
+
+        Returns:
+            pd.DataFrame: lot_number, machine_name, date, quantity, frozen列を持つDataFrame
+        """
+        if len(self._frozen_chunks) > 1:
+            # 確定済みの部分は一度だけ連結して以後はそれを使う
+            self._frozen_chunks = [pd.concat(self._frozen_chunks, ignore_index=True)]
+        return (
+            self._concat(self._frozen_chunks + [self._live])
+            .sort_values(["machine_name", "lot_number", "date"], kind="stable")
+            .reset_index(drop=True)
+        )
+
+    def to_lot_infos(self) -> pd.DataFrame:
+        """
+        get_lot_infosと同じ形式（productions列が日付→数量の辞書）で返す
+
+        Returns:
+            pd.DataFrame: 全期間の生産予定を持つLotInfo情報のDataFrame
+        """
+        long_df = self.to_frame()
+        if long_df.empty:
+            return pd.DataFrame()
+        productions = {
+            lot_number: dict(zip(group["date"], group["quantity"]))
+            for lot_number, group in long_df.groupby("lot_number", sort=False)
+        }
+        records = []
+        for lot_number, attributes in self._lots.items():
+            if lot_number in productions:
+                record = dict(attributes)
+                record["productions"] = productions[lot_number]
+                records.append(record)
+        return pd.DataFrame(records, columns=self._columns)
+
+    @classmethod
+    def _concat(cls, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """空のDataFrameを除いて連結する"""
+        frames = [frame[cls.COLUMNS] for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=cls.COLUMNS)
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Shared fixtures for ktec_smt_schedule tests."""
+
+import pytest
+import pandas as pd
+from datetime import datetime, timedelta
+
+
+@pytest.fixture
+def make_lot_infos():
+    """列の値からget_lot_infosの結果を模したDataFrameを作る関数
+
+    productionsは {日付文字列: 数量} のリストで指定し、日付はTimestampに変換する。
+    """
+
+    def build(**columns) -> pd.DataFrame:
+        if "productions" in columns:
+            columns["productions"] = [
+                {pd.Timestamp(day): quantity for day, quantity in plan.items()}
+                for plan in columns["productions"]
+            ]
+        return pd.DataFrame(columns)
+
+    return build
+
+
+@pytest.fixture
+def sheet_rows():
+    """実際のスケジュールシートと同じ列構成の行データを作る関数（pd.read_excelの行位置）"""
+
+    def build(days: int = 23, header_row: int = 6, spacer_rows: int = 3):
+        start = datetime(2025, 9, 26)
+        header = [None, "品 目 名 称", None, "指図－工程", None, "基 準"]
+        header += ["前 月 累 計", "日付"]
+        header += [start + timedelta(days=d) for d in range(days)]
+        header += ["ＣＨＩＰ本数", "異形　本数", "総本数", None, None]
+        header += ["タクト/　　　台　　　(ｓｅｃ）", "稼働率(%)"]
+        header += [None, "前工程", None, "切替", "取数", None]
+        width = len(header)
+        date_col = 8
+
+        def blank():
+            return [None] * width
+
+        rows = [blank() for _ in range(header_row)]
+        rows.append(header)
+        rows += [blank() for _ in range(spacer_rows)]
+
+        lots = [
+            ("1198772-20", "772ALCD/REFRS", 640),
+            ("1198755-20", "770AMAIN/REFRS", 160),
+        ]
+        for n, (lot_number, board, volume) in enumerate(lots):
+            lot_row = blank()
+            lot_row[1] = "CN-SNDFJ0CJ"
+            lot_row[3] = lot_number
+            lot_row[5] = datetime(2025, 9, 24)
+            lot_row[7] = "GC03"
+            lot_row[date_col + days - 1 - n] = volume
+            lot_row[width - 8] = 40
+            lot_row[width - 7] = 0.8
+            lot_row[width - 3] = 0.25
+            lot_row[width - 2] = 1
+            board_row = blank()
+            board_row[1] = board
+            board_row[3] = "Y8470815R"
+            board_row[6] = volume
+            board_row[width - 7] = 72
+            board_row[width - 2] = 17
+            rows += [lot_row, board_row]
+        return rows
+
+    return build
+
+
+@pytest.fixture
+def schedule_dir(tmp_path, sheet_rows):
+    """35日分のGC03.xlsx を格納したディレクトリ"""
+    openpyxl = pytest.importorskip("openpyxl")
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["タイトル"])
+    for row in sheet_rows(days=35):
+        sheet.append(row)
+    workbook.save(tmp_path / "GC03.xlsx")
+    return str(tmp_path)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for ScheduleArchive class."""
+
+import os
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+from ktec_smt_schedule.archive import (
+    ScheduleArchive,
+    ArchiveAggregator,
+    LineMonthVolumeAggregator,
+    LotLeadTimeAggregator,
+    PlanStabilityAggregator,
+)
+from ktec_smt_schedule.smt_schedule import SMTSchedule
+
+
+class CountAggregator(ArchiveAggregator):
+    """処理したスナップショット数を数える集計器"""
+
+    name = "count"
+
+    def initial_state(self):
+        return 0
+
+    def update(self, snapshot, df):
+        self.state += 1
+
+    def result(self):
+        return pd.DataFrame({"count": [self.state]})
+
+
+def with_horizon(df: pd.DataFrame, start: str, end: str) -> pd.DataFrame:
+    """GC01のエクスポートの日付範囲を記録する"""
+    df.attrs["horizons"] = {"GC01": (pd.Timestamp(start), pd.Timestamp(end))}
+    return df
+
+
+class TestArchiveAggregators:
+    """組み込み集計器のテストケース"""
+
+    def test_line_month_volume_drops_cancelled(self, make_lot_infos):
+        """日付範囲内で取り消された予定を月別数量から除くテスト"""
+        aggregator = LineMonthVolumeAggregator()
+        first = make_lot_infos(
+            machine_name=["GC01", "GC01"],
+            lot_number=["A", "B"],
+            productions=[{"2025-10-01": 100}, {"2025-10-05": 50}],
+        )
+        aggregator.update("20251001", with_horizon(first, "2025-10-01", "2025-10-23"))
+        # 翌日はBが取り消され、Aのみ
+        second = first.iloc[:1].copy()
+        aggregator.update("20251002", with_horizon(second, "2025-10-02", "2025-10-24"))
+
+        result = aggregator.result()
+        assert result["quantity"].tolist() == [100]
+
+    def test_line_month_volume_state_is_bounded(self, make_lot_infos):
+        """日付範囲より前の日を月別合計に畳み込み、状態が増え続けないテスト"""
+        aggregator = LineMonthVolumeAggregator()
+        for snapshot in pd.date_range("2025-09-01", "2025-10-30"):
+            days = pd.date_range(snapshot, periods=3)
+            df = make_lot_infos(
+                machine_name=["GC01"],
+                lot_number=["A"],
+                productions=[{day: 10 for day in days}],
+            )
+            aggregator.update(
+                snapshot.strftime("%Y%m%d"),
+                with_horizon(df, str(days[0].date()), str(days[-1].date())),
+            )
+
+        assert len(aggregator.state["daily"]) == 3
+        result = aggregator.result()
+        assert list(result["month"]) == ["2025-09", "2025-10", "2025-11"]
+        assert list(result["quantity"]) == [300, 310, 10]
+
+    def test_plan_stability(self, make_lot_infos):
+        """指図ごとの数量・日付の変更を数えるテスト"""
+        aggregator = PlanStabilityAggregator()
+        first = make_lot_infos(
+            machine_name=["GC01"] * 3,
+            lot_number=["A", "B", "D"],
+            productions=[
+                {"2025-10-02": 100, "2025-10-03": 100},
+                {"2025-10-04": 50},
+                {"2025-10-06": 30},
+            ],
+        )
+        second = make_lot_infos(
+            machine_name=["GC01"] * 3,
+            lot_number=["A", "C", "D"],
+            productions=[
+                {"2025-10-02": 100, "2025-10-03": 80},
+                {"2025-10-05": 10},
+                {"2025-10-06": 30},
+            ],
+        )
+        aggregator.update("20251001", with_horizon(first, "2025-10-01", "2025-10-23"))
+        aggregator.update("20251002", with_horizon(second, "2025-10-02", "2025-10-24"))
+
+        row = aggregator.result().iloc[0]
+        assert row["snapshot"] == "20251002"
+        assert row["lots"] == 4
+        assert row["changed_lots"] == 3
+        # Bの取り消しとCの追加
+        assert row["date_changed_lots"] == 2
+        assert row["quantity_change"] == 20 + 50 + 10
+        assert row["stability"] == 0.25
+
+
+class TestScheduleArchive:
+    """ScheduleArchiveクラスのテストケース"""
+
+    @pytest.fixture
+    def archive_dir(self, tmp_path):
+        """3日分のスナップショットを持つアーカイブディレクトリ"""
+        for snapshot in ["20251001", "20251002", "20251003"]:
+            (tmp_path / snapshot).mkdir()
+        return tmp_path
+
+    @pytest.fixture
+    def fake_get_lot_infos(self, make_lot_infos):
+        """スナップショットごとのget_lot_infos結果を返す関数"""
+
+        def get_lot_infos(dir_path, start_line, end_line, output_csv=True):
+            assert output_csv is False
+            day = pd.Timestamp(os.path.basename(dir_path))
+            return make_lot_infos(
+                machine_name=["GC01", "GC02"],
+                lot_number=["1198827-10", "1198829-10"],
+                productions=[
+                    {day: 100, day + pd.Timedelta(days=1): 200},
+                    {day + pd.Timedelta(days=2): 300},
+                ],
+            )
+
+        return get_lot_infos
+
+    def test_snapshots_sorted(self, archive_dir):
+        """スナップショットが名前順に列挙されるテスト"""
+        (archive_dir / "dummy.txt").write_text("x")
+        archive = ScheduleArchive(str(archive_dir), 1, 2)
+
+        assert archive.snapshots() == ["20251001", "20251002", "20251003"]
+
+    def test_snapshots_missing_dir(self, tmp_path):
+        """存在しないディレクトリのテスト"""
+        archive = ScheduleArchive(str(tmp_path / "missing"), 1, 2)
+
+        with pytest.raises(FileNotFoundError):
+            archive.snapshots()
+
+    def test_run_builtin_aggregators(self, archive_dir, fake_get_lot_infos):
+        """組み込み集計器のテスト"""
+        archive = ScheduleArchive(str(archive_dir), 1, 2)
+
+        with patch.object(SMTSchedule, "get_lot_infos", fake_get_lot_infos):
+            results = archive.run(
+                [LineMonthVolumeAggregator(), LotLeadTimeAggregator()]
+            )
+
+        volume = results["line_month_volume"]
+        # GC01: 10/01〜10/04の各日100〜200（重複日は最新値）
+        gc01 = volume[volume["machine_name"] == "GC01"]["quantity"].iloc[0]
+        assert gc01 == 100 + 100 + 100 + 200
+        lead_time = results["lot_lead_time"].set_index("lot_number")
+        assert lead_time.loc["1198829-10", "first_seen"] == pd.Timestamp("20251001")
+        assert lead_time.loc["1198829-10", "lead_time_days"] == 4
+
+    def test_run_resumes_from_checkpoint(
+        self, archive_dir, tmp_path, fake_get_lot_infos
+    ):
+        """チェックポイントからの再開テスト"""
+        checkpoint = str(tmp_path / "archive.ckpt")
+
+        with patch.object(SMTSchedule, "get_lot_infos", fake_get_lot_infos):
+            first = ScheduleArchive(str(archive_dir), 1, 2, checkpoint, chunk_size=2)
+            first.run([CountAggregator()])
+            assert os.path.exists(checkpoint)
+
+            # 新しいスナップショットを追加して再実行
+            (archive_dir / "20251004").mkdir()
+            second = ScheduleArchive(str(archive_dir), 1, 2, checkpoint, chunk_size=2)
+            with patch.object(
+                ScheduleArchive,
+                "iter_snapshots",
+                wraps=second.iter_snapshots,
+            ) as mock_iter:
+                results = second.run([CountAggregator()])
+
+        mock_iter.assert_called_once_with(after="20251003")
+        assert results["count"]["count"].iloc[0] == 4
+
+    def test_run_plan_stability_resumes(
+        self, archive_dir, tmp_path, fake_get_lot_infos
+    ):
+        """計画の安定性の集計がチェックポイントから再開できるテスト"""
+        checkpoint = str(tmp_path / "archive.ckpt")
+
+        with patch.object(SMTSchedule, "get_lot_infos", fake_get_lot_infos):
+            ScheduleArchive(str(archive_dir), 1, 2, checkpoint, chunk_size=1).run(
+                [PlanStabilityAggregator()]
+            )
+            (archive_dir / "20251004").mkdir()
+            results = ScheduleArchive(
+                str(archive_dir), 1, 2, checkpoint, chunk_size=1
+            ).run([PlanStabilityAggregator()])
+
+        stability = results["plan_stability"]
+        assert list(stability.columns) == PlanStabilityAggregator.COLUMNS
+        gc01 = stability[stability["machine_name"] == "GC01"]
+        # 重なる1日の数量が200→100に変わる
+        assert list(gc01["snapshot"]) == ["20251002", "20251003", "20251004"]
+        assert list(gc01["changed_lots"]) == [1, 1, 1]
+        assert list(gc01["quantity_change"]) == [100.0, 100.0, 100.0]
+
+    def test_run_duplicate_names(self, archive_dir):
+        """集計名の重複エラーテスト"""
+        archive = ScheduleArchive(str(archive_dir), 1, 2)
+
+        with pytest.raises(ValueError):
+            archive.run([CountAggregator(), CountAggregator()])
+
+    def test_invalid_chunk_size(self, archive_dir):
+        """chunk_sizeの検証テスト"""
+        with pytest.raises(ValueError):
+            ScheduleArchive(str(archive_dir), 1, 2, chunk_size=0)
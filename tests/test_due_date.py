@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for DueDateAnalyzer class."""
+
+import pytest
+import pandas as pd
+from datetime import date
+
+from ktec_smt_schedule.due_date import DueDateAnalyzer
+from ktec_smt_schedule.smt_schedule import SMTSchedule
+
+
+class TestDueDateAnalyzer:
+    """DueDateAnalyzerクラスのテストケース"""
+
+    @pytest.fixture
+    def lot_infos(self, make_lot_infos):
+        """get_lot_infosの結果を模したDataFrame"""
+        return make_lot_infos(
+            machine_name=["GC01", "GC01", "GC02"],
+            lot_number=["A", "B", "C"],
+            # 2025-10-03 は金曜日
+            default_date=[pd.Timestamp("2025-10-03"), pd.Timestamp("2025-10-03"), None],
+            volume=[2000.0, 3000.0, 480.0],
+            rest_volume=[0, 1000, float("nan")],
+            productions=[
+                {"2025-10-01": 1000, "2025-10-02": 1000},
+                {"2025-10-06": 600, "2025-10-07": 0},
+                {"2025-10-01": 480},
+            ],
+        )
+
+    def test_analyze(self, lot_infos):
+        """指図ごとの余裕日数・遅れの計算テスト"""
+        result = DueDateAnalyzer().analyze(lot_infos).set_index("lot_number")
+
+        assert result.loc["A", "planned_completion"] == pd.Timestamp("2025-10-02")
+        assert result.loc["A", "slack_days"] == 1
+        assert not result.loc["A", "is_late"]
+        assert result.loc["A", "unplanned_volume"] == 0
+
+        # 金曜の基準に対して月曜完了は稼働日で1日遅れ（数量0の日は無視）
+        assert result.loc["B", "planned_completion"] == pd.Timestamp("2025-10-06")
+        assert result.loc["B", "slack_days"] == -1
+        assert result.loc["B", "lateness_days"] == 1
+        assert result.loc["B", "remaining_volume"] == 1000
+        assert result.loc["B", "unplanned_volume"] == 400
+
+        assert pd.isna(result.loc["C", "slack_days"])
+        assert not result.loc["C", "is_late"]
+
+    def test_analyze_with_holidays(self, lot_infos):
+        """休日を考慮した稼働日数のテスト"""
+        analyzer = DueDateAnalyzer(holidays=[date(2025, 10, 2)])
+        result = analyzer.analyze(lot_infos).set_index("lot_number")
+
+        assert result.loc["A", "slack_days"] == 0
+
+    def test_summary(self, lot_infos):
+        """ラインごとの集計テスト"""
+        analyzer = DueDateAnalyzer()
+        analyzer.update(lot_infos)
+
+        summary = analyzer.summary().set_index("machine_name")
+
+        assert summary.loc["GC01", "lots"] == 2
+        assert summary.loc["GC01", "late_lots"] == 1
+        assert summary.loc["GC01", "late_quantity"] == 600
+        assert summary.loc["GC01", "max_lateness_days"] == 1
+        assert summary.loc["GC02", "late_lots"] == 0
+
+    def test_update_single_line(self, lot_infos):
+        """1ラインだけの再計算テスト"""
+        analyzer = DueDateAnalyzer()
+        analyzer.update(lot_infos)
+
+        gc01 = lot_infos[lot_infos["machine_name"] == "GC01"].reset_index(drop=True)
+        gc01.at[1, "productions"] = {pd.Timestamp("2025-10-03"): 1000}
+        analyzer.update(gc01)
+
+        result = analyzer.result().set_index("lot_number")
+        assert len(result) == 3
+        assert result.loc["B", "slack_days"] == 0
+        assert result.loc["C", "machine_name"] == "GC02"
+
+    def test_update_removes_empty_line(self, lot_infos):
+        """指図がなくなったラインの削除テスト"""
+        analyzer = DueDateAnalyzer()
+        analyzer.update(lot_infos)
+        analyzer.update(pd.DataFrame(), lines=["GC02"])
+
+        assert list(analyzer.summary()["machine_name"]) == ["GC01"]
+
+    def test_empty(self):
+        """空のDataFrameのテスト"""
+        analyzer = DueDateAnalyzer()
+
+        assert analyzer.analyze(pd.DataFrame()).empty
+        assert analyzer.summary().empty
+
+    def test_analyze_rest_volume_from_sheet(self, tmp_path, sheet_rows):
+        """シートの残台数を残数量に使うテスト"""
+        openpyxl = pytest.importorskip("openpyxl")
+
+        rows = sheet_rows(days=35)
+        # 1件目の指図行の前月累計（残台数）
+        rows[10][6] = 55
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["タイトル"])
+        for row in rows:
+            sheet.append(row)
+        workbook.save(tmp_path / "GC03.xlsx")
+
+        df = SMTSchedule.get_lot_info(str(tmp_path), "GC03", output_csv=False)
+        result = DueDateAnalyzer().analyze(df).set_index("lot_number")
+
+        assert list(df["rest_volume"]) == [55, 0]
+        assert result.loc["1198772-20", "remaining_volume"] == 55
+        assert result.loc["1198755-20", "remaining_volume"] == 160
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for FederatedSchedule class."""
+
+import json
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+from ktec_smt_schedule.federation import FederatedSchedule, ScheduleSource
+from ktec_smt_schedule.smt_schedule import SMTSchedule
+
+
+def fake_get_lot_info(dir_path, line_code, output_csv=True):
+    """ファイル名からLotInfoのDataFrameを模して返す"""
+    if line_code.startswith("BAD"):
+        raise Exception("ファイル読み取りエラー: broken")
+    return pd.DataFrame(
+        {
+            "machine_name": [line_code.split(".")[0]],
+            "lot_number": [f"{line_code}-1"],
+        }
+    )
+
+
+class TestFederatedSchedule:
+    """FederatedScheduleクラスのテストケース"""
+
+    @pytest.fixture
+    def plants(self, tmp_path):
+        """2工場分のディレクトリ"""
+        plant1 = tmp_path / "plant1"
+        plant1.mkdir()
+        for name in ["GC01.xls", "GC02.xls", "GC02.xlsx", "GC3.xls", "memo.txt"]:
+            (plant1 / name).write_text("x")
+        plant2 = tmp_path / "plant2"
+        plant2.mkdir()
+        for name in ["L-A.xlsx", "L-B.xlsx", "BAD-C.xlsx"]:
+            (plant2 / name).write_text("x")
+        return plant1, plant2
+
+    def test_discover_line_codes(self, plants):
+        """globによるラインファイルの検出テスト"""
+        plant1, _ = plants
+
+        assert SMTSchedule.discover_line_codes(str(plant1)) == ["GC01.xls", "GC02.xlsx"]
+
+    def test_load(self, plants, tmp_path):
+        """複数工場の並行読み込みテスト"""
+        plant1, plant2 = plants
+        sources = [
+            ScheduleSource("P1", str(plant1)),
+            {"plant_id": "P2", "dir_path": str(plant2), "pattern": "*-?.xlsx"},
+            ScheduleSource("P3", str(tmp_path / "missing")),
+        ]
+
+        with patch.object(SMTSchedule, "get_lot_info", side_effect=fake_get_lot_info):
+            result = FederatedSchedule.load(sources)
+
+        assert list(result.lots.columns[:2]) == ["plant_id", "machine_name"]
+        assert list(result.lots["machine_name"]) == ["GC01", "GC02", "L-A", "L-B"]
+        assert list(result.lots["plant_id"]) == ["P1", "P1", "P2", "P2"]
+
+        status = result.status.set_index("plant_id")
+        assert status.loc["P1", "lines"] == 2
+        assert status.loc["P2", "lots"] == 2
+        assert "BAD-C.xlsx" in status.loc["P2", "line_errors"]
+        assert status.loc["P3", "error"] != ""
+        assert (status["elapsed_sec"] >= 0).all()
+        assert list(result.errors) == ["P3"]
+
+    def test_load_duplicate_plant(self, plants):
+        """工場IDの重複エラーテスト"""
+        plant1, _ = plants
+
+        with pytest.raises(ValueError):
+            FederatedSchedule.load(
+                [ScheduleSource("P1", str(plant1)), ScheduleSource("P1", str(plant1))]
+            )
+
+    def test_load_manifest(self, tmp_path):
+        """マニフェストの読み込みテスト"""
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(
+            json.dumps([{"plant_id": "P1", "dir_path": "/share/p1"}]), encoding="utf-8"
+        )
+
+        sources = FederatedSchedule.load_manifest(str(manifest))
+
+        assert sources == [ScheduleSource("P1", "/share/p1")]
+
+    def test_load_empty(self):
+        """読み込み元がない場合のテスト"""
+        result = FederatedSchedule.load([])
+
+        assert result.lots.empty
+        assert result.status.empty
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for ScheduleLayout class."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime, timedelta
+
+from ktec_smt_schedule import records
+from ktec_smt_schedule.layout import ScheduleLayout, _is_blank
+from ktec_smt_schedule.smt_schedule import SMTSchedule
+
+
+class TestScheduleLayout:
+    """ScheduleLayoutクラスのテストケース"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """テストごとにレイアウトキャッシュを消去"""
+        ScheduleLayout.clear_cache()
+        yield
+        ScheduleLayout.clear_cache()
+
+    def test_detect_default_layout(self, sheet_rows):
+        """従来の固定レイアウトと同じ位置を検出するテスト"""
+        layout = ScheduleLayout.detect(sheet_rows())
+
+        assert layout == ScheduleLayout(
+            header_row=6,
+            data_start=7,
+            first_col=1,
+            date_start=7,
+            date_stop=30,
+            filter_col=36,
+            tact_col=35,
+            changeover_col=40,
+        )
+
+    def test_detect_longer_horizon(self, sheet_rows):
+        """日付列が増えたレイアウトの検出テスト"""
+        layout = ScheduleLayout.detect(sheet_rows(days=35, header_row=3))
+
+        assert layout.header_row == 3
+        assert layout.data_start == 4
+        assert len(layout.date_columns) == 35
+        assert layout.filter_col == 36 + 12
+
+    def test_detect_string_dates_without_filter_label(self, sheet_rows):
+        """文字列の日付ラベルと判定列ラベルなしの検出テスト"""
+        rows = sheet_rows()
+        header = rows[6]
+        for j in range(8, 31):
+            header[j] = header[j].strftime("%Y-%m-%d")
+        header[header.index("稼働率(%)")] = None
+
+        layout = ScheduleLayout.detect(rows)
+
+        assert layout.date_columns == range(7, 30)
+        assert layout.filter_col == 30 + ScheduleLayout.FILTER_OFFSET
+
+    def test_is_blank(self):
+        """空のセルの判定テスト（records と同じ判定を使う）"""
+        for value in [None, float("nan"), pd.NaT, pd.NA, np.datetime64("NaT")]:
+            assert _is_blank(value)
+        for value in [0, "", "nan", datetime(2025, 10, 1)]:
+            assert not _is_blank(value)
+        assert records._is_blank is _is_blank
+
+    def test_detect_missing_header(self):
+        """ヘッダー行がない場合のエラーテスト"""
+        with pytest.raises(ValueError, match="ヘッダー行"):
+            ScheduleLayout.detect([[None] * 10 for _ in range(20)])
+
+    def test_detect_missing_key_column(self, sheet_rows):
+        """キー列がない場合のエラーテスト"""
+        rows = sheet_rows()
+        rows[6][rows[6].index("取数")] = None
+
+        with pytest.raises(ValueError, match="取数"):
+            ScheduleLayout.detect(rows)
+
+    def test_resolve_uses_cache_for_same_layout(self, sheet_rows, monkeypatch):
+        """日付だけが異なる同じレイアウトはキャッシュを使うテスト"""
+        first = ScheduleLayout.resolve(sheet_rows())
+
+        next_day = sheet_rows()
+        next_day[6][8:31] = [d + timedelta(days=1) for d in next_day[6][8:31]]
+
+        def fail_detect(rows):
+            raise AssertionError("detect should not be called")
+
+        monkeypatch.setattr(ScheduleLayout, "detect", fail_detect)
+        assert ScheduleLayout.resolve(next_day) is first
+
+    def test_resolve_detects_new_layout(self, sheet_rows):
+        """別のレイアウトは再検出するテスト"""
+        first = ScheduleLayout.resolve(sheet_rows())
+        second = ScheduleLayout.resolve(sheet_rows(days=35))
+
+        assert first != second
+        assert len(second.date_columns) == 35
+
+
+class TestXlsxLoading:
+    """.xlsx 形式の読み込みテスト"""
+
+    def test_get_lot_info_xlsx(self, schedule_dir):
+        """.xlsx ファイルからLotInfoを生成するテスト"""
+        result = SMTSchedule.get_lot_info(schedule_dir, "GC03", output_csv=False)
+
+        assert list(result["lot_number"]) == ["1198772-20", "1198755-20"]
+        assert list(result["board_name"]) == ["772ALCD", "770AMAIN"]
+        assert result.iloc[0]["productions"] == {datetime(2025, 10, 30): 640}
+        assert result.iloc[1]["machine_name"] == "GC03"
+        assert result.iloc[0]["tact"] == 40.0
+        assert result.iloc[0]["changeover_time"] == 0.25
+        assert result.attrs["horizons"] == {
+            "GC03": (pd.Timestamp("2025-09-26"), pd.Timestamp("2025-10-30"))
+        }
+
+    @pytest.mark.parametrize("spacer_rows", [0, 2, 5])
+    def test_get_lot_info_spacer_rows(self, tmp_path, sheet_rows, spacer_rows):
+        """ヘッダー行とデータ行の間の空行の数が異なるシートのテスト"""
+        openpyxl = pytest.importorskip("openpyxl")
+
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["タイトル"])
+        for row in sheet_rows(days=35, spacer_rows=spacer_rows):
+            sheet.append(row)
+        workbook.save(tmp_path / "GC03.xlsx")
+
+        result = SMTSchedule.get_lot_info(str(tmp_path), "GC03", output_csv=False)
+
+        assert list(result["lot_number"]) == ["1198772-20", "1198755-20"]
+        assert list(result["board_name"]) == ["772ALCD", "770AMAIN"]
+
+    def test_resolve_path_prefers_xlsx(self, tmp_path):
+        """.xlsx と .xls が両方ある場合のパス解決テスト"""
+        (tmp_path / "GC01.xls").write_text("xls")
+        assert SMTSchedule.resolve_path(str(tmp_path), "GC01").endswith("GC01.xls")
+
+        (tmp_path / "GC01.xlsx").write_text("xlsx")
+        assert SMTSchedule.resolve_path(str(tmp_path), "GC01").endswith("GC01.xlsx")
+        assert SMTSchedule.resolve_path(str(tmp_path), "GC01.xls").endswith(
+            "GC01.xls"
+        )
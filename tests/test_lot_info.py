@@ -29,6 +29,8 @@ class TestLotInfo:
         assert lot_info.line_code == ""
         assert lot_info.productions == {}
         assert lot_info.divisions_volume == 0
+        assert lot_info.tact == 0.0
+        assert lot_info.changeover_time == 0.0
 
     def test_lot_info_attribute_assignment(self):
         """LotInfoの属性設定テスト"""
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for ScheduleRecords class."""
+
+import io
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ktec_smt_schedule.records import ScheduleRecords
+from ktec_smt_schedule.smt_schedule import SMTSchedule
+
+
+class TestScheduleRecords:
+    """ScheduleRecordsクラスのテストケース"""
+
+    def test_get_lot_records_matches_get_lot_info(self, schedule_dir):
+        """get_lot_infoと同じ内容のレコードを返すテスト"""
+        records = ScheduleRecords.get_lot_records(schedule_dir, "GC03")
+        expected = SMTSchedule.get_lot_info(schedule_dir, "GC03", output_csv=False)
+
+        assert list(records[0]) == ScheduleRecords.FIELDS
+        assert records[0]["productions"] == {datetime(2025, 10, 30): 640}
+        pd.testing.assert_frame_equal(ScheduleRecords.to_frame(records), expected)
+
+    def test_get_lot_info_xls_matches_xlsx(
+        self, schedule_dir, sheet_rows, monkeypatch
+    ):
+        """.xls も.xlsx と同じ読み込みで同じ結果になるテスト"""
+        xlrd = pytest.importorskip("xlrd")
+        from xlrd.sheet import Cell
+
+        def to_cell(value):
+            if value is None:
+                return Cell(xlrd.XL_CELL_EMPTY, "")
+            if isinstance(value, datetime):
+                serial = (value - datetime(1899, 12, 30)).total_seconds() / 86400
+                return Cell(xlrd.XL_CELL_DATE, serial)
+            if isinstance(value, str):
+                return Cell(xlrd.XL_CELL_TEXT, value)
+            return Cell(xlrd.XL_CELL_NUMBER, float(value))
+
+        # xlrdが返すセルと同じ型・値を持つシート
+        rows = [["タイトル"]] + sheet_rows(days=35)
+        cells = [[to_cell(value) for value in row] for row in rows]
+        sheet = SimpleNamespace(nrows=len(cells), row=lambda r: cells[r])
+        book = SimpleNamespace(
+            datemode=0,
+            sheet_by_index=lambda index: sheet,
+            release_resources=lambda: None,
+        )
+        monkeypatch.setattr(xlrd, "open_workbook", lambda path, **kwargs: book)
+        open(os.path.join(schedule_dir, "GC03.xls"), "w").close()
+
+        xls = SMTSchedule.get_lot_info(schedule_dir, "GC03.xls", output_csv=False)
+        xlsx = SMTSchedule.get_lot_info(schedule_dir, "GC03.xlsx", output_csv=False)
+
+        pd.testing.assert_frame_equal(xls, xlsx)
+        assert xls.attrs["horizons"] == xlsx.attrs["horizons"]
+
+    def test_load_sheet_reads_rows_once(self, schedule_dir, sheet_rows, monkeypatch):
+        """シートを1回だけ走査し、指図行・基板行だけを保持するテスト"""
+        iter_rows = ScheduleRecords.iter_rows
+        read = []
+
+        def counting_iter_rows(path):
+            for row in iter_rows(path):
+                read.append(row)
+                yield row
+
+        monkeypatch.setattr(
+            ScheduleRecords, "iter_rows", staticmethod(counting_iter_rows)
+        )
+        header, data, layout = ScheduleRecords.load_sheet(schedule_dir, "GC03")
+
+        assert len(read) == 1 + len(sheet_rows(days=35))
+        assert [row[2] for row in data] == [
+            "1198772-20",
+            "Y8470815R",
+            "1198755-20",
+            "Y8470815R",
+        ]
+        assert all(len(row) == len(header) for row in data)
+
+    def test_get_lot_info_blank_numeric_cells(self, tmp_path, sheet_rows):
+        """空欄の台数・分割台数がpd.read_excelと同じNaN（float64）になるテスト"""
+        openpyxl = pytest.importorskip("openpyxl")
+
+        rows = sheet_rows(days=35)
+        # すべての指図行の取数と基板行の前月累計（台数）を空欄にする
+        for lot_row in (10, 12):
+            rows[lot_row][rows[6].index("取数")] = None
+            rows[lot_row + 1][6] = None
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["タイトル"])
+        for row in rows:
+            sheet.append(row)
+        workbook.save(tmp_path / "GC03.xlsx")
+
+        result = SMTSchedule.get_lot_info(str(tmp_path), "GC03", output_csv=False)
+
+        assert result["volume"].dtype == np.float64
+        assert result["divisions_volume"].dtype == np.float64
+        assert result["volume"].isna().all()
+        assert result["divisions_volume"].isna().all()
+
+    def test_get_lot_records_projection(self, schedule_dir):
+        """fields / dates で項目と期間を絞り込むテスト"""
+        records = ScheduleRecords.get_lot_records(
+            schedule_dir,
+            "GC03",
+            fields=["productions", "lot_number"],
+            dates=(None, datetime(2025, 10, 29)),
+        )
+
+        assert records == [
+            {
+                "lot_number": "1198755-20",
+                "productions": {datetime(2025, 10, 29): 160},
+            }
+        ]
+
+    def test_date_range(self):
+        """期間の指定の正規化テスト"""
+        day = datetime(2025, 10, 30).date()
+
+        assert ScheduleRecords._date_range(np.datetime64("2025-10-30")) == (day, day)
+        assert ScheduleRecords._date_range(
+            [np.datetime64("2025-10-29T12:00"), "2025/10/30"]
+        ) == (datetime(2025, 10, 29).date(), day)
+        assert ScheduleRecords._date_range((None, pd.Timestamp(day))) == (None, day)
+
+    @pytest.mark.parametrize(
+        "dates",
+        [
+            "20251030",
+            np.datetime64("NaT"),
+            ("2025-10-01", "x"),
+            ["2025-10-01", "2025-10-02", "2025-10-03"],
+        ],
+    )
+    def test_date_range_invalid(self, schedule_dir, dates):
+        """日付に変換できない期間のエラーテスト"""
+        with pytest.raises(ValueError):
+            ScheduleRecords._date_range(dates)
+        with pytest.raises(ValueError):
+            ScheduleRecords.get_lot_records(schedule_dir, "GC03", dates=dates)
+        with pytest.raises(ValueError):
+            SMTSchedule.get_lot_info(schedule_dir, "GC03", dates=dates)
+
+    def test_get_lot_records_datetime64(self, schedule_dir):
+        """datetime64で期間を指定するテスト"""
+        records = ScheduleRecords.get_lot_records(
+            schedule_dir, "GC03", dates=np.datetime64("2025-10-30")
+        )
+
+        assert [record["lot_number"] for record in records] == ["1198772-20"]
+
+    def test_get_all_lot_records_skips_missing(self, schedule_dir, capsys):
+        """存在しないラインを飛ばして連結するテスト"""
+        records = ScheduleRecords.get_all_lot_records(
+            schedule_dir, 2, 3, fields=["lot_number"]
+        )
+
+        assert records == [{"lot_number": "1198772-20"}, {"lot_number": "1198755-20"}]
+        assert "ファイルが見つかりません: GC02" in capsys.readouterr().out
+
+    def test_import_without_pandas(self):
+        """パッケージとScheduleRecordsの読み込みでpandasを読み込まないテスト"""
+        code = (
+            "import sys; import ktec_smt_schedule;"
+            "ktec_smt_schedule.ScheduleRecords;"
+            "assert 'pandas' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_to_columns(self, schedule_dir):
+        """項目ごとのNumPy配列に変換するテスト"""
+        records = ScheduleRecords.get_lot_records(schedule_dir, "GC03")
+        columns = ScheduleRecords.to_columns(records, ["lot_number", "volume", "tact"])
+
+        assert list(columns) == ["lot_number", "volume", "tact"]
+        assert columns["lot_number"].dtype == object
+        np.testing.assert_array_equal(columns["volume"], [640.0, 160.0])
+        np.testing.assert_array_equal(columns["tact"], [40.0, 40.0])
+
+    def test_to_ndjson(self, schedule_dir):
+        """NDJSONに変換するテスト"""
+        records = ScheduleRecords.get_lot_records(schedule_dir, "GC03")
+        text = ScheduleRecords.to_ndjson(records)
+        lines = [json.loads(line) for line in text.splitlines()]
+
+        assert len(lines) == 2
+        assert lines[0]["default_date"] == "2025-09-24T00:00:00"
+        assert lines[0]["productions"] == {"2025-10-30T00:00:00": 640}
+
+        buffer = io.StringIO()
+        assert ScheduleRecords.to_ndjson(records, buffer) is None
+        assert buffer.getvalue() == text
+
+    def test_to_db_insert(self, schedule_dir):
+        """DB-APIのexecutemanyで一括登録するテスト"""
+        records = ScheduleRecords.get_lot_records(schedule_dir, "GC03")
+        connection = sqlite3.connect(":memory:")
+        connection.execute(
+            "CREATE TABLE lots (lot_number TEXT, volume INTEGER, productions TEXT)"
+        )
+
+        sql, params = ScheduleRecords.to_db_insert(
+            records, "lots", ["lot_number", "volume", "productions"]
+        )
+        connection.executemany(sql, params)
+        sql, params = ScheduleRecords.to_db_insert(
+            records[:1], "lots", ["lot_number"], paramstyle="named"
+        )
+        connection.executemany(sql, params)
+
+        rows = connection.execute("SELECT * FROM lots").fetchall()
+        assert rows == [
+            ("1198772-20", 640, '{"2025-10-30T00:00:00": 640}'),
+            ("1198755-20", 160, '{"2025-10-29T00:00:00": 160}'),
+            ("1198772-20", None, None),
+        ]
+
+    def test_to_db_insert_unknown_paramstyle(self):
+        """対応していないparamstyleのテスト"""
+        with pytest.raises(ValueError, match="paramstyle"):
+            ScheduleRecords.to_db_insert([], "lots", paramstyle="unknown")
+
+    @pytest.mark.parametrize(
+        "table", ["lots; DROP TABLE lots", "lots (x)", "1lots", "main.lots.x", ""]
+    )
+    def test_to_db_insert_invalid_table(self, table):
+        """テーブル名に識別子以外を指定した場合のエラーテスト"""
+        with pytest.raises(ValueError, match="テーブル名"):
+            ScheduleRecords.to_db_insert([], table)
+
+    def test_to_db_insert_unknown_field(self):
+        """LotInfoにない項目を指定した場合のエラーテスト"""
+        records = [{"lot_number": "A", "volume) VALUES (1); --": 1}]
+
+        with pytest.raises(ValueError, match="LotInfo"):
+            ScheduleRecords.to_db_insert(records, "lots")
+        with pytest.raises(ValueError, match="LotInfo"):
+            ScheduleRecords.to_db_insert([], "lots", ["lot_number", "unknown"])
+
+        sql, _ = ScheduleRecords.to_db_insert([], "main.lots", ["volume", "lot_number"])
+        assert sql == "INSERT INTO main.lots (volume, lot_number) VALUES (?, ?)"
+
+    def test_to_frame_empty(self):
+        """レコードがない場合は空のDataFrameを返すテスト"""
+        assert ScheduleRecords.to_frame([]).empty
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for SetupFamily class."""
+
+import pytest
+import pandas as pd
+
+from ktec_smt_schedule.setup_family import SetupFamily
+
+
+class TestSetupFamily:
+    """SetupFamilyクラスのテストケース"""
+
+    @pytest.fixture
+    def lot_infos(self, make_lot_infos):
+        """get_lot_infosの結果を模したDataFrame（GC01はA→B→A→Bの順）"""
+        return make_lot_infos(
+            machine_name=["GC01", "GC01", "GC01", "GC01", "GC02"],
+            model_name=["M1", "M2", "M1", "M2", "M3"],
+            board_name=["772ALCD", "770AMAIN", "772ALCD", "770AMAIN", "MAIN"],
+            lot_number=["L1", "L2", "L3", "L4", "L5"],
+            model_code=["Y1", "Y2", "Y1", "Y2", "Y3"],
+            changeover_time=[0.25, 0.5, 0.25, 0.0, 0.25],
+            productions=[
+                {"2025-10-01": 100},
+                {"2025-10-02": 100},
+                {"2025-10-03": 100},
+                {"2025-10-04": 100},
+                {"2025-10-01": 100},
+            ],
+        )
+
+    def test_assign(self, lot_infos):
+        """ファミリーの割り当てテスト"""
+        result = SetupFamily.assign(lot_infos)
+
+        assert result.loc[0, "family"] == "772ALCD|Y1"
+        assert result.loc[0, "family_key"] == result.loc[2, "family_key"]
+        assert result.loc[0, "family_key"] != result.loc[1, "family_key"]
+
+    def test_assign_with_barcode(self, tmp_path, lot_infos):
+        """barcode_model.csvを使ったファミリーの割り当てテスト"""
+        csv_path = tmp_path / "barcode_model.csv"
+        pd.DataFrame(
+            {
+                "model": ["M1", "M2"],
+                "board": ["772ALCD", "770AMAIN"],
+                "barcode": ["L1", "L2"],
+            }
+        ).to_csv(csv_path, encoding="cp932", index=False)
+
+        result = SetupFamily.assign(
+            lot_infos, keys=["board_name"], barcode_path=str(csv_path)
+        )
+
+        assert list(result["barcode"]) == ["L1", "L2", "L1", "L2", ""]
+        assert result.loc[1, "family"] == "770AMAIN|L2"
+
+    def test_sequence_and_summary(self, lot_infos):
+        """現在の並びでの切替回数とコストのテスト"""
+        df = SetupFamily.assign(lot_infos)
+
+        seq = SetupFamily.sequence(df, default_cost=1.0)
+        assert list(seq["lot_number"]) == ["L1", "L2", "L3", "L4", "L5"]
+        assert list(seq["changeover"]) == [False, True, True, True, False]
+
+        summary = SetupFamily.summary(df, default_cost=1.0).set_index("machine_name")
+        assert summary.loc["GC01", "changeovers"] == 3
+        assert summary.loc["GC01", "changeover_cost"] == 0.5 + 0.25 + 1.0
+        assert summary.loc["GC01", "batched_changeovers"] == 1
+        assert summary.loc["GC02", "changeovers"] == 0
+
+    def test_suggest_order(self, lot_infos):
+        """ファミリー単位にまとめた並び順の提案テスト"""
+        df = SetupFamily.assign(lot_infos)
+
+        result = SetupFamily.suggest_order(df)
+        gc01 = result[result["machine_name"] == "GC01"]
+
+        assert list(gc01["lot_number"]) == ["L1", "L3", "L2", "L4"]
+        assert list(gc01["current_rank"]) == [0, 2, 1, 3]
+        assert list(gc01["suggested_rank"]) == [0, 1, 2, 3]
+        assert gc01["changeover"].sum() == 1
+
+    def test_empty(self):
+        """空のDataFrameのテスト"""
+        df = SetupFamily.assign(pd.DataFrame())
+
+        assert SetupFamily.sequence(df).empty
+        assert SetupFamily.summary(df).empty
+        assert SetupFamily.suggest_order(df).empty
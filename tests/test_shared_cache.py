@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for SharedScheduleCache class."""
+
+import os
+import pytest
+import numpy as np
+import pandas as pd
+
+from ktec_smt_schedule.shared_cache import SharedScheduleCache
+
+
+class TestSharedScheduleCache:
+    """SharedScheduleCacheクラスのテストケース"""
+
+    @pytest.fixture
+    def lot_infos(self, make_lot_infos):
+        """get_lot_infosの結果を模したDataFrame"""
+        return make_lot_infos(
+            machine_name=["GC01", "GC02"],
+            model_name=["VCB-NPB2F", "VCB-MB551"],
+            lot_number=["1198827-10", "1198839-10"],
+            default_date=[pd.Timestamp("2025-10-02"), None],
+            volume=[2000.0, 480.0],
+            productions=[
+                {"2025-10-02": 2000, "2025-10-03": 500},
+                {"2025-10-04": 480},
+            ],
+        )
+
+    def test_publish_and_attach(self, tmp_path, lot_infos):
+        """公開した世代をmmapでアタッチするテスト"""
+        writer = SharedScheduleCache(str(tmp_path))
+        generation = writer.publish(lot_infos)
+
+        reader = SharedScheduleCache(str(tmp_path))
+        assert reader.attach() == generation
+
+        assert isinstance(reader.lots["volume"], np.memmap)
+        assert reader.lots["lot_number"][1] == "1198839-10"
+        assert reader.lots["default_date"].dtype == np.dtype("datetime64[D]")
+        assert np.isnat(reader.lots["default_date"][1])
+
+        long_df = reader.productions_frame()
+        assert len(long_df) == 3
+        assert list(long_df["machine_name"]) == ["GC01", "GC01", "GC02"]
+        assert long_df["quantity"].sum() == 2980
+
+        lots = reader.lots_frame()
+        assert list(lots.columns) == [
+            "machine_name",
+            "model_name",
+            "lot_number",
+            "default_date",
+            "volume",
+        ]
+
+    def test_refresh_switches_generation(self, tmp_path, lot_infos):
+        """新しい世代の公開後にrefreshで切り替わるテスト"""
+        writer = SharedScheduleCache(str(tmp_path))
+        writer.publish(lot_infos)
+        reader = SharedScheduleCache(str(tmp_path))
+        reader.attach()
+
+        assert reader.refresh() is False
+
+        writer.publish(lot_infos.assign(volume=[3000.0, 480.0]))
+        assert reader.refresh() is True
+        assert reader.generation == "gen-000002"
+        assert reader.lots["volume"][0] == 3000.0
+
+    def test_cleanup_keeps_generations(self, tmp_path, lot_infos):
+        """古い世代の削除テスト"""
+        writer = SharedScheduleCache(str(tmp_path))
+        for _ in range(4):
+            writer.publish(lot_infos, keep=2)
+
+        generations = sorted(n for n in os.listdir(tmp_path) if n.startswith("gen-"))
+        assert generations == ["gen-000003", "gen-000004"]
+        assert writer.current_generation() == "gen-000004"
+
+    def test_publish_empty(self, tmp_path):
+        """空のget_lot_infos結果を公開した世代のテスト"""
+        SharedScheduleCache(str(tmp_path)).publish(pd.DataFrame())
+
+        reader = SharedScheduleCache(str(tmp_path))
+        reader.attach()
+
+        long_df = reader.productions_frame()
+        assert long_df.empty
+        assert list(long_df.columns) == [
+            "lot_number",
+            "machine_name",
+            "date",
+            "quantity",
+        ]
+        assert reader.lots_frame().empty
+
+    def test_attach_without_publish(self, tmp_path):
+        """未公開のキャッシュへのアタッチエラーテスト"""
+        with pytest.raises(FileNotFoundError):
+            SharedScheduleCache(str(tmp_path)).attach()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for ShiftPlanner class."""
+
+import pytest
+import pandas as pd
+from datetime import date
+
+from ktec_smt_schedule.shift import ShiftCalendar, ShiftPlanner
+
+
+def allocation(result: pd.DataFrame, lot_number: str):
+    """指定した指図の {(稼働日, シフト): 数量} を返す"""
+    df = result[result["lot_number"] == lot_number]
+    return {
+        (row.work_date.strftime("%m-%d"), row.shift): row.quantity
+        for row in df.itertuples()
+    }
+
+
+class TestShiftPlanner:
+    """ShiftPlannerクラスのテストケース"""
+
+    @pytest.fixture
+    def calendar(self):
+        """日勤60台分・夜勤30台分のシフトカレンダー"""
+        return ShiftCalendar([("day", 3600), ("night", 1800)])
+
+    @pytest.fixture
+    def lot_infos(self, make_lot_infos):
+        """get_lot_infosの結果を模したDataFrame（タクト60秒）"""
+        return make_lot_infos(
+            machine_name=["GC01", "GC01", "GC01", "GC02"],
+            lot_number=["A", "B", "C", "D"],
+            tact=[60.0, 60.0, 60.0, 0.0],
+            productions=[
+                {"2025-10-01": 50},
+                {"2025-10-01": 30},
+                {"2025-10-02": 100},
+                {"2025-10-01": 10},
+            ],
+        )
+
+    def test_expand_with_carry_over(self, calendar, lot_infos):
+        """シフトへの割り当てと翌日への繰り越しのテスト"""
+        result = ShiftPlanner.expand(lot_infos, calendar)
+
+        assert allocation(result, "A") == {("10-01", "day"): 50}
+        assert allocation(result, "B") == {
+            ("10-01", "day"): 10,
+            ("10-01", "night"): 20,
+        }
+        assert allocation(result, "C") == {
+            ("10-02", "day"): 60,
+            ("10-02", "night"): 30,
+            ("10-03", "day"): 10,
+        }
+        assert result.groupby("lot_number")["quantity"].sum().to_dict() == {
+            "A": 50,
+            "B": 30,
+            "C": 100,
+            "D": 10,
+        }
+
+    def test_expand_carry_over_from_previous_day(self, calendar, lot_infos):
+        """前日の繰り越しが当日の指図を押し出すテスト"""
+        lot_infos.at[1, "productions"] = {pd.Timestamp("2025-10-01"): 60}
+
+        result = ShiftPlanner.expand(lot_infos, calendar)
+
+        assert allocation(result, "B") == {
+            ("10-01", "day"): 10,
+            ("10-01", "night"): 30,
+            ("10-02", "day"): 20,
+        }
+        assert allocation(result, "C")[("10-02", "day")] == 40
+
+    def test_expand_zero_tact_and_default(self, calendar, lot_infos):
+        """タクト未設定の指図のテスト"""
+        result = ShiftPlanner.expand(lot_infos, calendar)
+        assert allocation(result, "D") == {("10-01", "day"): 10}
+
+        result = ShiftPlanner.expand(lot_infos, calendar, default_tact=360)
+        assert allocation(result, "D") == {("10-01", "day"): 10}
+
+    def test_expand_holiday_and_line_shifts(self, lot_infos):
+        """休日とライン別シフトのテスト"""
+        calendar = ShiftCalendar(
+            [("day", 3600), ("night", 1800)],
+            line_shifts={"GC02": [("day", 300)]},
+            holidays=[date(2025, 10, 3)],
+        )
+
+        result = ShiftPlanner.expand(lot_infos, calendar, default_tact=60)
+
+        assert allocation(result, "C")[("10-04", "day")] == 10
+        assert allocation(result, "D") == {
+            ("10-01", "day"): 5,
+            ("10-02", "day"): 5,
+        }
+
+    def test_expand_empty(self, calendar):
+        """空のDataFrameのテスト"""
+        result = ShiftPlanner.expand(pd.DataFrame(), calendar)
+
+        assert result.empty
+        assert list(result.columns) == ShiftPlanner.COLUMNS
+
+    def test_calendar_without_capacity(self):
+        """稼働時間のないカレンダーのエラーテスト"""
+        with pytest.raises(ValueError):
+            ShiftCalendar([("day", 0)])
@@ -9,6 +9,7 @@ import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
+from datetime import datetime
 
 # パッケージからインポート
 from ktec_smt_schedule.smt_schedule import SMTSchedule
@@ -104,16 +105,17 @@ class TestSMTSchedule:
         with pytest.raises(Exception, match="ファイル読み取りエラー"):
             SMTSchedule.get_lot_info(temp_dir, "GC01")
 
-    @patch("pandas.read_excel")
-    def test_get_lot_info_success(self, mock_read_excel, temp_dir, sample_excel_data):
+    @patch("ktec_smt_schedule.records.ScheduleRecords.iter_rows")
+    def test_get_lot_info_success(self, mock_iter_rows, temp_dir, sample_excel_data):
         """正常なファイル読み込みのテスト"""
         # Excelファイルを作成
         excel_path = os.path.join(temp_dir, "GC01.xls")
         with open(excel_path, "w") as f:
             f.write("dummy excel file")
 
-        # pandas.read_excelのモック設定
-        mock_read_excel.return_value = sample_excel_data
+        # シート読み込みのモック設定（1行目は列名の行）
+        rows = [list(sample_excel_data.columns)] + sample_excel_data.values.tolist()
+        mock_iter_rows.return_value = (row for row in rows)
 
         # CSVファイル出力のモック
         with patch.object(pd.DataFrame, "to_csv"):
@@ -166,6 +168,104 @@ class TestSMTSchedule:
         assert isinstance(result, pd.DataFrame)
         assert result.empty
 
+    def test_get_lot_info_projection(self, schedule_dir):
+        """fields / dates で項目と期間を絞り込むテスト"""
+        full = SMTSchedule.get_lot_info(schedule_dir, "GC03", output_csv=False)
+        result = SMTSchedule.get_lot_info(
+            schedule_dir,
+            "GC03",
+            output_csv=False,
+            fields=["productions", "lot_number", "machine_name"],
+            dates=datetime(2025, 10, 30).date(),
+        )
+
+        assert list(result.columns) == ["machine_name", "lot_number", "productions"]
+        assert list(result["lot_number"]) == ["1198772-20"]
+        assert result.iloc[0]["productions"] == full.iloc[0]["productions"]
+        assert result.iloc[0]["machine_name"] == full.iloc[0]["machine_name"]
+
+        # 開始日のみ指定した場合は以降の全日付
+        result = SMTSchedule.get_lot_info(
+            schedule_dir,
+            "GC03",
+            output_csv=False,
+            dates=(datetime(2025, 10, 29), None),
+        )
+        pd.testing.assert_frame_equal(result, full)
+
+    def test_get_lot_info_unknown_field(self, temp_dir):
+        """存在しない項目を指定した場合のテスト"""
+        with pytest.raises(ValueError, match="unknown"):
+            SMTSchedule.get_lot_info(temp_dir, "GC03", fields=["unknown"])
+
+    def test_get_lot_infos_projection(self, schedule_dir):
+        """get_lot_infosで fields / dates を全ラインに適用するテスト"""
+        result = SMTSchedule.get_lot_infos(
+            schedule_dir,
+            1,
+            3,
+            output_csv=False,
+            fields=["lot_number", "productions"],
+            dates=(datetime(2025, 10, 29), datetime(2025, 10, 29)),
+        )
+
+        assert list(result.columns) == ["lot_number", "productions"]
+        assert list(result["lot_number"]) == ["1198755-20"]
+        assert result.iloc[0]["productions"] == {datetime(2025, 10, 29): 160}
+        assert result.attrs["horizons"] == {
+            "GC03": (pd.Timestamp("2025-10-29"), pd.Timestamp("2025-10-29"))
+        }
+
+    def test_explode_productions(self):
+        """productions列の縦持ち展開テスト"""
+        df = pd.DataFrame(
+            {
+                "machine_name": ["GC01", "GC02"],
+                "lot_number": ["1198827-10", "1198829-10"],
+                "productions": [
+                    {pd.Timestamp("2025-10-02"): 2000, pd.Timestamp("2025-10-03"): 500},
+                    {pd.Timestamp("2025-10-03"): 3000},
+                ],
+            }
+        )
+
+        result = SMTSchedule.explode_productions(df)
+
+        assert list(result.columns) == ["lot_number", "machine_name", "date", "quantity"]
+        assert len(result) == 3
+        assert result["quantity"].sum() == 5500
+        assert result.iloc[2]["machine_name"] == "GC02"
+
+    def test_get_horizons(self):
+        """記録された日付範囲と、記録がないラインの予定の範囲のテスト"""
+        df = pd.DataFrame(
+            {
+                "machine_name": ["GC01", "GC02"],
+                "lot_number": ["1198827-10", "1198829-10"],
+                "productions": [
+                    {pd.Timestamp("2025-10-02"): 2000},
+                    {pd.Timestamp("2025-10-03"): 3000, pd.Timestamp("2025-10-05"): 1},
+                ],
+            }
+        )
+        df.attrs["horizons"] = {
+            "GC01": (pd.Timestamp("2025-10-01"), pd.Timestamp("2025-10-23")),
+            "GC03": (pd.Timestamp("2025-10-01"), pd.Timestamp("2025-10-23")),
+        }
+
+        assert SMTSchedule.get_horizons(df) == {
+            "GC01": (pd.Timestamp("2025-10-01"), pd.Timestamp("2025-10-23")),
+            "GC02": (pd.Timestamp("2025-10-03"), pd.Timestamp("2025-10-05")),
+            "GC03": (pd.Timestamp("2025-10-01"), pd.Timestamp("2025-10-23")),
+        }
+
+    def test_explode_productions_empty(self):
+        """空のDataFrameの展開テスト"""
+        result = SMTSchedule.explode_productions(pd.DataFrame())
+
+        assert result.empty
+        assert "quantity" in result.columns
+
     def test_read_csv_utf8_bom_success(self, temp_dir):
         """UTF-8-BOM CSV読み込みのテスト"""
         # テスト用CSVファイルを作成
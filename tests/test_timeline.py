@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for ScheduleTimeline class."""
+
+import pytest
+import pandas as pd
+from datetime import date
+
+from ktec_smt_schedule.timeline import ScheduleTimeline
+
+
+def as_dict(timeline: ScheduleTimeline, lot_number: str):
+    """指定した指図の {日付文字列: (数量, 確定)} を返す"""
+    df = timeline.to_frame()
+    df = df[df["lot_number"] == lot_number]
+    return {
+        row.date.strftime("%m-%d"): (row.quantity, row.frozen)
+        for row in df.itertuples()
+    }
+
+
+class TestScheduleTimeline:
+    """ScheduleTimelineクラスのテストケース"""
+
+    @pytest.fixture
+    def make_export(self, make_lot_infos):
+        """指図番号→{日付文字列: 数量}からget_lot_infosの結果を模したDataFrameを作る関数"""
+
+        def build(plans) -> pd.DataFrame:
+            return make_lot_infos(
+                machine_name=["GC01"] * len(plans),
+                lot_number=list(plans.keys()),
+                productions=list(plans.values()),
+            )
+
+        return build
+
+    def test_first_update_freezes_past(self, make_export):
+        """最初の取り込みで基準日より前が確定されるテスト"""
+        timeline = ScheduleTimeline()
+        timeline.update(
+            make_export({"A": {"2025-10-01": 100, "2025-10-03": 200}}),
+            as_of=date(2025, 10, 2),
+        )
+
+        assert as_dict(timeline, "A") == {
+            "10-01": (100, True),
+            "10-03": (200, False),
+        }
+        assert timeline.frozen_until == pd.Timestamp("2025-10-02")
+
+    def test_overwrites_future_and_keeps_frozen(self, make_export):
+        """未来日は上書きし、確定済みの日付は変更しないテスト"""
+        timeline = ScheduleTimeline()
+        timeline.update(
+            make_export({"A": {"2025-10-01": 100, "2025-10-03": 200}}),
+            as_of=date(2025, 10, 2),
+        )
+        timeline.update(
+            make_export(
+                {"A": {"2025-10-01": 999, "2025-10-02": 50, "2025-10-04": 150}}
+            ),
+            as_of=date(2025, 10, 3),
+        )
+
+        assert as_dict(timeline, "A") == {
+            "10-01": (100, True),
+            "10-02": (50, True),
+            "10-04": (150, False),
+        }
+
+    def test_keeps_plan_beyond_new_window(self, make_export):
+        """新しいエクスポートの日付範囲外の未来の予定を残すテスト"""
+        timeline = ScheduleTimeline()
+        timeline.update(
+            make_export({"A": {"2025-10-05": 100}, "B": {"2025-10-30": 300}}),
+            as_of=date(2025, 10, 1),
+            horizon=(date(2025, 9, 28), date(2025, 10, 30)),
+        )
+        timeline.update(
+            make_export({"A": {"2025-10-06": 100}}),
+            as_of=date(2025, 10, 2),
+            horizon=(date(2025, 9, 29), date(2025, 10, 21)),
+        )
+
+        assert as_dict(timeline, "A") == {"10-06": (100, False)}
+        assert as_dict(timeline, "B") == {"10-30": (300, False)}
+
+    def test_removes_cancelled_lot(self, make_export):
+        """エクスポートの日付範囲内で取り消された指図の予定を削除するテスト"""
+        timeline = ScheduleTimeline()
+        timeline.update(
+            make_export(
+                {"A": {"2025-10-05": 100, "2025-10-06": 100}, "B": {"2025-10-15": 99}}
+            ),
+            as_of=date(2025, 10, 5),
+            horizon=(date(2025, 10, 1), date(2025, 10, 23)),
+        )
+        timeline.update(
+            make_export(
+                {"A": {"2025-10-05": 100, "2025-10-06": 100, "2025-10-07": 100}}
+            ),
+            as_of=date(2025, 10, 6),
+            horizon=(date(2025, 10, 2), date(2025, 10, 24)),
+        )
+
+        assert as_dict(timeline, "B") == {}
+        assert as_dict(timeline, "A") == {
+            "10-05": (100, True),
+            "10-06": (100, False),
+            "10-07": (100, False),
+        }
+
+    def test_horizon_from_attrs(self, make_export):
+        """get_lot_infosが記録したラインごとの日付範囲を使うテスト"""
+        timeline = ScheduleTimeline()
+        timeline.update(
+            make_export({"A": {"2025-10-05": 100}, "B": {"2025-10-15": 99}}),
+            as_of=date(2025, 10, 5),
+        )
+        export = make_export({"A": {"2025-10-06": 100}})
+        export.attrs["horizons"] = {
+            "GC01": (pd.Timestamp("2025-10-02"), pd.Timestamp("2025-10-24"))
+        }
+        timeline.update(export, as_of=date(2025, 10, 6))
+
+        assert as_dict(timeline, "B") == {}
+        assert as_dict(timeline, "A") == {"10-06": (100, False)}
+
+    def test_rejects_older_export(self, make_export):
+        """確定済みより前のエクスポートのエラーテスト"""
+        timeline = ScheduleTimeline()
+        timeline.update(
+            make_export({"A": {"2025-10-05": 100}}), as_of=date(2025, 10, 3)
+        )
+
+        with pytest.raises(ValueError):
+            timeline.update(
+                make_export({"A": {"2025-10-05": 100}}), as_of=date(2025, 10, 2)
+            )
+
+    def test_to_lot_infos(self, make_export):
+        """get_lot_infos形式への変換テスト"""
+        timeline = ScheduleTimeline()
+        for day in range(1, 6):
+            timeline.update(
+                make_export({"A": {f"2025-10-{day:02d}": day * 10}}),
+                as_of=date(2025, 10, day),
+            )
+
+        result = timeline.to_lot_infos()
+
+        assert list(result.columns) == ["machine_name", "lot_number", "productions"]
+        assert len(result.iloc[0]["productions"]) == 5
+        assert result.iloc[0]["productions"][pd.Timestamp("2025-10-05")] == 50
+
+    def test_empty_timeline(self):
+        """空のタイムラインのテスト"""
+        timeline = ScheduleTimeline()
+
+        assert timeline.to_frame().empty
+        assert timeline.to_lot_infos().empty